@@ -252,6 +252,11 @@ def _prepare() -> int:
 
 
 def _log_sys_info(args: Arguments) -> None:
+	# everything below is debug-only, so don't pay for lspci/systemd-detect-virt
+	# on a normal run where log() would drop the lines anyway
+	if output.log_level > logging.DEBUG:
+		return
+
 	bitness = SysInfo._bitness()
 	debug(f'Hardware model detected: {SysInfo.sys_vendor()} {SysInfo.product_name()}')
 	debug(f'UEFI mode: {SysInfo.has_uefi()} Bitness: {bitness if bitness is not None else "N/A"} Arch: {SysInfo.arch()}')
@@ -36,37 +36,37 @@ class UserList(ListManager[User]):
 
 	@override
 	def handle_action(self, action: str, entry: User | None, data: list[User]) -> list[User]:
+		# usernames are unique, so key by them for O(1) lookup/replace/delete
+		by_name = {u.username: u for u in data}
+		user = by_name.get(entry.username) if entry else None
+
 		if action == self._actions[0]:  # add
 			if (new_user := self._add_user()) is not None:
 				# in case a user with the same username as an existing user
-				# was created we'll replace the existing one
-				data = [d for d in data if d.username != new_user.username]
-				data += [new_user]
-				self._data = data  # update before showing sub-menu
+				# was created we'll replace the existing one (moved to the end)
+				by_name.pop(new_user.username, None)
+				by_name[new_user.username] = new_user
+				self._data = list(by_name.values())  # update before showing sub-menu
 				self._run_actions_on_entry(new_user)
-		elif action == self._actions[1] and entry:  # manage stash urls
-			user = next(filter(lambda x: x == entry, data))
+				return self._data
+		elif action == self._actions[1] and user:  # manage stash urls
 			user.stash_urls = self._manage_stash_urls(user)
-		elif action == self._actions[2] and entry:  # change password
-			header = f'{"User"}: {entry.username}\n'
+		elif action == self._actions[2] and user:  # change password
+			header = f'{"User"}: {user.username}\n'
 			new_password = get_password('Password', header=header)
 
 			if new_password:
-				user = next(filter(lambda x: x == entry, data))
 				user.password = new_password
-		elif action == self._actions[3] and entry:  # change shell
-			user = next(filter(lambda x: x == entry, data))
+		elif action == self._actions[3] and user:  # change shell
 			user.shell = _select_shell(user.shell, elev=user.elev)
-		elif action == self._actions[4] and entry:  # manage groups
-			user = next(filter(lambda x: x == entry, data))
+		elif action == self._actions[4] and user:  # manage groups
 			user.groups = _select_groups(user.groups)
-		elif action == self._actions[5] and entry:  # promote/demote
-			user = next(filter(lambda x: x == entry, data))
+		elif action == self._actions[5] and user:  # promote/demote
 			user.elev = not user.elev
-		elif action == self._actions[6] and entry:  # delete
-			data = [d for d in data if d != entry]
+		elif action == self._actions[6] and user:  # delete
+			del by_name[user.username]
 
-		return data
+		return list(by_name.values())
 
 	def _check_for_correct_username(self, username: str | None) -> str | None:
 		if username is not None and re.match(r'^[a-z_][a-z0-9_-]*\$?$', username) and len(username) <= 32:
@@ -37,14 +37,16 @@ def clean_cache(root_dir: str) -> None:
 	info('Cleaning up...')
 	try:
 		for dirpath, dirnames, _ in os.walk(root_dir):
-			for dirname in dirnames:
-				if dirname.lower() == '__pycache__':
-					full_path = Path(dirpath) / dirname
-					try:
-						rmtree(full_path)
-						deleted.append(full_path)
-					except Exception as e:
-						info(f'Failed to delete {full_path}: {e}')
+			if '__pycache__' not in dirnames:
+				continue
+			# pruned so the walk doesn't try to descend into what we remove
+			dirnames.remove('__pycache__')
+			full_path = Path(dirpath) / '__pycache__'
+			try:
+				rmtree(full_path)
+				deleted.append(full_path)
+			except Exception as e:
+				info(f'Failed to delete {full_path}: {e}')
 	except KeyboardInterrupt, PermissionError:
 		pass
 
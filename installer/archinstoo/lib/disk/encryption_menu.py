@@ -27,6 +27,31 @@ from archinstoo.lib.tui.types import Alignment, FrameProperties, Orientation
 if TYPE_CHECKING:
 	from archinstoo.lib.models.users import Password
 
+# fixed prompt text, built once instead of on every call
+_ENC_PROMPT_HEADER = 'Enter disk encryption password (leave blank for no encryption)\n'
+_ITER_TIME_HEADER = (
+	'Enter iteration time for LUKS encryption (in milliseconds)\n'
+	'Higher values increase security but slow down boot time\n'
+	f'Default: {DEFAULT_ITER_TIME}ms, Recommended range: 1000-60000\n'
+)
+_AUTO_UNLOCK_HEADER = 'Embed a keyfile in initramfs so root is auto-unlocked ?\nThis avoids entering encryption password twice on boot.\n'
+_FIDO2_HEADER = 'Select a FIDO2 token to enroll as a LUKS keyslot\nPassphrase keyslot stays as fallback.\n'
+_TPM2_HEADER = (
+	'Bind a TPM2 keyslot to the LUKS device(s) so the disk auto-unlocks at boot ?\n'
+	'PCR selection picked separately. Defaults to 0+7.\n'
+	'Passphrase keyslot stays as fallback.\n'
+)
+
+# which encryption types enable which menu items
+_ENCRYPTING_TYPES = frozenset({EncryptionType.LUKS, EncryptionType.LVM_ON_LUKS, EncryptionType.LUKS_ON_LVM})
+_PARTITION_ENC_TYPES = frozenset({EncryptionType.LUKS, EncryptionType.LVM_ON_LUKS})
+_LVM_VOL_ENC_TYPES = frozenset({EncryptionType.LUKS_ON_LVM})
+
+# iteration time bounds; the floor is the /boot clamp
+_ITER_TIME_MAX = 120000
+_ITER_TIME_MIN_ERR = f'Iteration time must be at least {BOOT_ITER_TIME}ms'
+_ITER_TIME_MAX_ERR = f'Iteration time must be at most {_ITER_TIME_MAX}ms'
+
 
 class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 	def __init__(
@@ -52,6 +77,26 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 		menu_options = self._define_menu_options()
 		self._item_group = MenuItemGroup(menu_options, sort_items=False, checkmarks=True)
 
+		# resolve items once: previews and dependency checks read them on
+		# every redraw, find_by_key would rescan the group each time
+		self._mi_enc_type = self._item_group.find_by_key('encryption_type')
+		self._mi_enc_password = self._item_group.find_by_key('encryption_password')
+		self._mi_pbkdf = self._item_group.find_by_key('pbkdf')
+		self._mi_iter_time = self._item_group.find_by_key('iter_time')
+		self._mi_cipher = self._item_group.find_by_key('cipher')
+		self._mi_partitions = self._item_group.find_by_key('partitions')
+		self._mi_lvm_volumes = self._item_group.find_by_key('lvm_volumes')
+		self._mi_auto_unlock_root = self._item_group.find_by_key('auto_unlock_root')
+		self._mi_tpm2_unlock = self._item_group.find_by_key('tpm2_unlock')
+		self._mi_tpm2_pcrs = self._item_group.find_by_key('tpm2_pcrs')
+		self._mi_fido2_device = self._item_group.find_by_key('fido2_device')
+
+		# (group version, last rendered preview)
+		self._preview_cache: tuple[int, str | None] | None = None
+		# sync_all_to_config() writes the items back into _enc_config on exit,
+		# so any other password found there afterwards was typed in this menu
+		self._preset_password = self._enc_config.encryption_password
+
 		super().__init__(
 			self._item_group,
 			self._enc_config,
@@ -155,15 +200,12 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 		return []
 
 	def _select_auto_unlock_root(self, preset: bool) -> bool:
-		prompt = 'Embed a keyfile in initramfs so root is auto-unlocked ?' + '\n'
-		prompt += 'This avoids entering encryption password twice on boot.' + '\n'
-
 		group = MenuItemGroup.yes_no()
 		group.set_focus_by_value(preset)
 
 		result = SelectMenu[bool](
 			group,
-			header=prompt,
+			header=_AUTO_UNLOCK_HEADER,
 			columns=2,
 			orientation=Orientation.HORIZONTAL,
 			alignment=Alignment.CENTER,
@@ -178,17 +220,15 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 			case _:
 				return preset
 
+	# None is in none of these, so the lookups need no separate null check
 	def _check_dep_enc_type(self) -> bool:
-		enc_type: EncryptionType | None = self._item_group.find_by_key('encryption_type').value
-		return bool(enc_type and enc_type != EncryptionType.NO_ENCRYPTION)
+		return self._mi_enc_type.value in _ENCRYPTING_TYPES
 
 	def _check_dep_partitions(self) -> bool:
-		enc_type: EncryptionType | None = self._item_group.find_by_key('encryption_type').value
-		return bool(enc_type and enc_type in [EncryptionType.LUKS, EncryptionType.LVM_ON_LUKS])
+		return self._mi_enc_type.value in _PARTITION_ENC_TYPES
 
 	def _check_dep_lvm_vols(self) -> bool:
-		enc_type: EncryptionType | None = self._item_group.find_by_key('encryption_type').value
-		return bool(enc_type and enc_type == EncryptionType.LUKS_ON_LVM)
+		return self._mi_enc_type.value in _LVM_VOL_ENC_TYPES
 
 	def _check_dep_auto_unlock(self) -> bool:
 		return self._allow_auto_unlock and self._check_dep_enc_type()
@@ -200,7 +240,7 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 		return bool(Fido2.get_cryptenroll_devices()) and self._check_dep_enc_type()
 
 	def _check_dep_tpm2_pcrs(self) -> bool:
-		return self._check_dep_tpm2() and bool(self._item_group.find_by_key('tpm2_unlock').value)
+		return self._check_dep_tpm2() and bool(self._mi_tpm2_unlock.value)
 
 	# Firmware-time PCRs are stable host->target so binding from the installer matches
 	# the target's first boot. OS-side PCRs need a different enrollment path that we do
@@ -239,9 +279,6 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 				return preset
 
 	def _select_fido2_device(self, preset: Fido2Device | None) -> Fido2Device | None:
-		header = 'Select a FIDO2 token to enroll as a LUKS keyslot' + '\n'
-		header += 'Passphrase keyslot stays as fallback.' + '\n'
-
 		devices = Fido2.get_cryptenroll_devices(reload=True)
 
 		if not devices:
@@ -253,7 +290,7 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 
 		result = SelectMenu[Fido2Device](
 			group,
-			header=header,
+			header=_FIDO2_HEADER,
 			alignment=Alignment.CENTER,
 			allow_skip=True,
 			allow_reset=True,
@@ -268,16 +305,12 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 				return result.get_value()
 
 	def _select_tpm2_unlock(self, preset: bool) -> bool:
-		prompt = 'Bind a TPM2 keyslot to the LUKS device(s) so the disk auto-unlocks at boot ?' + '\n'
-		prompt += 'PCR selection picked separately. Defaults to 0+7.' + '\n'
-		prompt += 'Passphrase keyslot stays as fallback.' + '\n'
-
 		group = MenuItemGroup.yes_no()
 		group.set_focus_by_value(preset)
 
 		result = SelectMenu[bool](
 			group,
-			header=prompt,
+			header=_TPM2_HEADER,
 			columns=2,
 			orientation=Orientation.HORIZONTAL,
 			alignment=Alignment.CENTER,
@@ -296,22 +329,23 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 	def run(self, additional_title: str | None = None) -> DiskEncryption | None:
 		super().run(additional_title=additional_title)
 
-		enc_type: EncryptionType | None = self._item_group.find_by_key('encryption_type').value
-		enc_password: Password | None = self._item_group.find_by_key('encryption_password').value
-		pbkdf: LuksPbkdf | None = self._item_group.find_by_key('pbkdf').value
-		iter_time: int | None = self._item_group.find_by_key('iter_time').value
-		cipher: EncryptionCipher | None = self._item_group.find_by_key('cipher').value
-		enc_partitions = self._item_group.find_by_key('partitions').value
-		enc_lvm_vols = self._item_group.find_by_key('lvm_volumes').value
-		auto_unlock_root: bool = self._item_group.find_by_key('auto_unlock_root').value or False
-		tpm2_unlock: bool = self._item_group.find_by_key('tpm2_unlock').value or False
-		tpm2_pcrs: str = self._item_group.find_by_key('tpm2_pcrs').value or '0+7'
-		fido2_device: Fido2Device | None = self._item_group.find_by_key('fido2_device').value
+		enc_type: EncryptionType | None = self._mi_enc_type.value
+		enc_password: Password | None = self._mi_enc_password.value
+		pbkdf: LuksPbkdf | None = self._mi_pbkdf.value
+		iter_time: int | None = self._mi_iter_time.value
+		cipher: EncryptionCipher | None = self._mi_cipher.value
+		enc_partitions = self._mi_partitions.value
+		enc_lvm_vols = self._mi_lvm_volumes.value
+		auto_unlock_root: bool = self._mi_auto_unlock_root.value or False
+		tpm2_unlock: bool = self._mi_tpm2_unlock.value or False
+		tpm2_pcrs: str = self._mi_tpm2_pcrs.value or '0+7'
+		fido2_device: Fido2Device | None = self._mi_fido2_device.value
 
 		if enc_type is None or enc_partitions is None or enc_lvm_vols is None:
+			self._discard_password()
 			return None
 
-		if enc_type in [EncryptionType.LUKS, EncryptionType.LVM_ON_LUKS] and enc_partitions:
+		if enc_type in _PARTITION_ENC_TYPES and enc_partitions:
 			enc_lvm_vols = []
 
 		if enc_type == EncryptionType.LUKS_ON_LVM:
@@ -332,98 +366,99 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 				fido2_device=fido2_device,
 			)
 
+		self._discard_password()
 		return None
 
-	def _preview(self, item: MenuItem) -> str | None:
-		output = ''
-
-		if (enc_type := self._prev_type()) is not None:
-			output += enc_type
-
-		if (enc_pwd := self._prev_password()) is not None:
-			output += f'\n{enc_pwd}'
-
-		if (pbkdf := self._prev_pbkdf()) is not None:
-			output += f'\n{pbkdf}'
-
-		if (iter_time := self._prev_iter_time()) is not None:
-			output += f'\n{iter_time}'
-
-		if (cipher := self._prev_cipher()) is not None:
-			output += f'\n{cipher}'
+	def _discard_password(self) -> None:
+		# nothing is returned, but _enc_config is the caller's preset: don't leave
+		# a password typed here behind in it
+		if self._enc_config.encryption_password is not self._preset_password:
+			self._enc_config.encryption_password = None
 
-		if (partitions := self._prev_partitions()) is not None:
-			output += f'\n\n{partitions}'
-
-		if (lvm := self._prev_lvm_vols()) is not None:
-			output += f'\n\n{lvm}'
+	def _preview(self, item: MenuItem) -> str | None:
+		# every item shares this preview, so reuse it until the group version moves
+		version = self._item_group.version
 
-		if (auto_unlock := self._prev_auto_unlock_root()) is not None:
-			output += f'\n{auto_unlock}'
+		if self._preview_cache is not None and self._preview_cache[0] == version:
+			return self._preview_cache[1]
 
-		if (tpm2 := self._prev_tpm2_unlock()) is not None:
-			output += f'\n{tpm2}'
+		output = self._build_preview()
+		self._preview_cache = (version, output)
+		return output
 
-		if (tpm2_pcrs := self._prev_tpm2_pcrs()) is not None:
-			output += f'\n{tpm2_pcrs}'
+	def _build_preview(self) -> str | None:
+		head = (
+			self._prev_type(),
+			self._prev_password(),
+			self._prev_pbkdf(),
+			self._prev_iter_time(),
+			self._prev_cipher(),
+		)
+		tables = (self._prev_partitions(), self._prev_lvm_vols())
+		tail = (
+			self._prev_auto_unlock_root(),
+			self._prev_tpm2_unlock(),
+			self._prev_tpm2_pcrs(),
+			self._prev_fido2_device(),
+		)
 
-		if (fido2 := self._prev_fido2_device()) is not None:
-			output += f'\n{fido2}'
+		parts = [section for section in head if section is not None]
+		# tables get a blank line above them
+		for table in tables:
+			if table is not None:
+				parts += ['', table]
+		parts.extend(section for section in tail if section is not None)
 
-		if not output:
+		if not parts:
 			return None
 
-		return output
+		return '\n'.join(parts)
 
 	def _prev_type(self) -> str | None:
-		if enc_type := self._item_group.find_by_key('encryption_type').value:
+		if enc_type := self._mi_enc_type.value:
 			enc_text = enc_type.type_to_text()
-			return f'{"Encryption type"}: {enc_text}'
+			return f'Encryption type: {enc_text}'
 
 		return None
 
 	def _prev_password(self) -> str | None:
-		if enc_pwd := self._item_group.find_by_key('encryption_password').value:
-			return f'{"Encryption password"}: {enc_pwd.hidden()}'
+		if enc_pwd := self._mi_enc_password.value:
+			return f'Encryption password: {enc_pwd.hidden()}'
 
 		return None
 
 	def _prev_partitions(self) -> str | None:
-		partitions: list[PartitionModification] | None = self._item_group.find_by_key('partitions').value
+		partitions: list[PartitionModification] | None = self._mi_partitions.value
 
 		if partitions:
-			output = 'Partitions to be encrypted' + '\n'
-			output += FormattedOutput.as_table(partitions)
-			return output.rstrip()
+			return f'Partitions to be encrypted\n{FormattedOutput.as_table(partitions).rstrip()}'
 
 		return None
 
 	def _prev_lvm_vols(self) -> str | None:
-		volumes: list[PartitionModification] | None = self._item_group.find_by_key('lvm_volumes').value
+		volumes: list[PartitionModification] | None = self._mi_lvm_volumes.value
 
 		if volumes:
-			output = 'LVM volumes to be encrypted' + '\n'
-			output += FormattedOutput.as_table(volumes)
-			return output.rstrip()
+			return f'LVM volumes to be encrypted\n{FormattedOutput.as_table(volumes).rstrip()}'
 
 		return None
 
 	def _prev_pbkdf(self) -> str | None:
-		pbkdf = self._item_group.find_by_key('pbkdf').value
-		enc_type = self._item_group.find_by_key('encryption_type').value
+		pbkdf = self._mi_pbkdf.value
+		enc_type = self._mi_enc_type.value
 
 		if pbkdf and enc_type != EncryptionType.NO_ENCRYPTION:
-			return f'{"Key derivation function"}: {pbkdf.display_name()}'
+			return f'Key derivation function: {pbkdf.display_name()}'
 
 		return None
 
 	def _prev_iter_time(self) -> str | None:
-		iter_time = self._item_group.find_by_key('iter_time').value
-		enc_type = self._item_group.find_by_key('encryption_type').value
+		iter_time = self._mi_iter_time.value
+		enc_type = self._mi_enc_type.value
 
 		if iter_time and enc_type != EncryptionType.NO_ENCRYPTION:
-			output = f'{"Iteration time"}: {iter_time}ms'
-			partitions = self._item_group.find_by_key('partitions').value
+			output = f'Iteration time: {iter_time}ms'
+			partitions = self._mi_partitions.value
 			if partitions and any(p.is_boot() for p in partitions):
 				output += f' (/boot: {BOOT_ITER_TIME}ms for GRUB)'
 			return output
@@ -431,47 +466,47 @@ class DiskEncryptionMenu(AbstractSubMenu[DiskEncryption]):
 		return None
 
 	def _prev_cipher(self) -> str | None:
-		cipher = self._item_group.find_by_key('cipher').value
-		enc_type = self._item_group.find_by_key('encryption_type').value
+		cipher = self._mi_cipher.value
+		enc_type = self._mi_enc_type.value
 
 		if cipher and enc_type != EncryptionType.NO_ENCRYPTION:
-			return f'{"Encryption cipher"}: {cipher.value}'
+			return f'Encryption cipher: {cipher.value}'
 
 		return None
 
 	def _prev_auto_unlock_root(self) -> str | None:
-		auto_unlock = self._item_group.find_by_key('auto_unlock_root').value
-		enc_type = self._item_group.find_by_key('encryption_type').value
+		auto_unlock = self._mi_auto_unlock_root.value
+		enc_type = self._mi_enc_type.value
 
 		if enc_type and enc_type != EncryptionType.NO_ENCRYPTION:
 			status = 'Enabled' if auto_unlock else 'Disabled'
-			return f'{"Auto unlock root"}: {status}'
+			return f'Auto unlock root: {status}'
 
 		return None
 
 	def _prev_tpm2_unlock(self) -> str | None:
-		enc_type = self._item_group.find_by_key('encryption_type').value
+		enc_type = self._mi_enc_type.value
 		if not enc_type or enc_type == EncryptionType.NO_ENCRYPTION:
 			return None
 		if not SysInfo.has_tpm2():
 			return None
 
-		tpm2 = self._item_group.find_by_key('tpm2_unlock').value
+		tpm2 = self._mi_tpm2_unlock.value
 		status = 'Enabled' if tpm2 else 'Disabled'
-		return f'{"TPM2 auto unlock"}: {status}'
+		return f'TPM2 auto unlock: {status}'
 
 	def _prev_tpm2_pcrs(self) -> str | None:
-		if not self._item_group.find_by_key('tpm2_unlock').value:
+		if not self._mi_tpm2_unlock.value:
 			return None
-		pcrs = self._item_group.find_by_key('tpm2_pcrs').value or '0+7'
-		return f'{"TPM2 PCRs"}: {pcrs}'
+		pcrs = self._mi_tpm2_pcrs.value or '0+7'
+		return f'TPM2 PCRs: {pcrs}'
 
 	def _prev_fido2_device(self) -> str | None:
-		enc_type = self._item_group.find_by_key('encryption_type').value
+		enc_type = self._mi_enc_type.value
 		if not enc_type or enc_type == EncryptionType.NO_ENCRYPTION:
 			return None
 
-		device: Fido2Device | None = self._item_group.find_by_key('fido2_device').value
+		device: Fido2Device | None = self._mi_fido2_device.value
 		if not device:
 			return None
 
@@ -514,10 +549,9 @@ def select_encryption_type(
 
 
 def select_encrypted_password() -> Password | None:
-	header = 'Enter disk encryption password (leave blank for no encryption)' + '\n'
 	return get_password(
 		text='Disk encryption password',
-		header=header,
+		header=_ENC_PROMPT_HEADER,
 		allow_skip=True,
 	)
 
@@ -526,14 +560,9 @@ def select_partitions_to_encrypt(
 	modification: list[DeviceModification],
 	preset: list[PartitionModification],
 ) -> list[PartitionModification]:
-	partitions: list[PartitionModification] = []
-
-	# do not allow encrypting the EFI system partition
-	for mod in modification:
-		partitions += [p for p in mod.partitions if not p.is_efi()]
-
-	# do not allow encrypting existing partitions that are not marked as wipe
-	avail_partitions = [p for p in partitions if not p.exists()]
+	# do not allow encrypting the EFI system partition, nor existing
+	# partitions that are not marked as wipe
+	avail_partitions = [p for mod in modification for p in mod.partitions if not p.is_efi() and not p.exists()]
 
 	if avail_partitions:
 		group = MenuHelper(data=avail_partitions).create_menu_group()
@@ -632,34 +661,32 @@ def select_cipher(preset: EncryptionCipher | None = None) -> EncryptionCipher |
 			return result.get_value()
 
 
-def select_iteration_time(preset: int | None = None) -> int | None:
-	header = 'Enter iteration time for LUKS encryption (in milliseconds)' + '\n'
-	header += 'Higher values increase security but slow down boot time' + '\n'
-	header += f'Default: {DEFAULT_ITER_TIME}ms, Recommended range: 1000-60000' + '\n'
+def _validate_iter_time(value: str | None) -> str | None:
+	if not value:
+		return None
 
-	def validate_iter_time(value: str | None) -> str | None:
-		if not value:
-			return None
+	try:
+		iter_time = int(value)
+	except ValueError:
+		return 'Please enter a valid number'
+
+	# floor matches the /boot clamp so the GRUB slot is never
+	# asked to go below what user picked
+	if iter_time < BOOT_ITER_TIME:
+		return _ITER_TIME_MIN_ERR
+	if iter_time > _ITER_TIME_MAX:
+		return _ITER_TIME_MAX_ERR
+	return None
 
-		try:
-			iter_time = int(value)
-			# floor matches the /boot clamp so the GRUB slot is never
-			# asked to go below what user picked
-			if iter_time < BOOT_ITER_TIME:
-				return f'Iteration time must be at least {BOOT_ITER_TIME}ms'
-			if iter_time > 120000:
-				return 'Iteration time must be at most 120000ms'
-			return None
-		except ValueError:
-			return 'Please enter a valid number'
 
+def select_iteration_time(preset: int | None = None) -> int | None:
 	result = EditMenu(
 		'Iteration time',
-		header=header,
+		header=_ITER_TIME_HEADER,
 		alignment=Alignment.CENTER,
 		allow_skip=True,
 		default_text=str(preset) if preset else str(DEFAULT_ITER_TIME),
-		validator=validate_iter_time,
+		validator=_validate_iter_time,
 	).input()
 
 	match result.type_:
@@ -1,7 +1,7 @@
+from functools import wraps
 from pathlib import Path
 from typing import TYPE_CHECKING, override
 
-from archinstoo.lib.disk.disk_menu import DiskLayoutConfigurationMenu
 from archinstoo.lib.models.application import DEFAULT_KERNEL, ApplicationConfiguration, ZramConfiguration
 from archinstoo.lib.models.device import DiskLayoutConfiguration, DiskLayoutType, EncryptionType, PartitionModification
 from archinstoo.lib.pm import list_available_packages
@@ -12,9 +12,6 @@ from archinstoo.lib.tui.menu_item import MenuItem, MenuItemGroup
 from archinstoo.lib.tui.result import ResultType
 from archinstoo.lib.tui.types import Alignment, Orientation
 
-from .applications.application_menu import ApplicationMenu
-from .authentication.authentication_menu import AuthenticationMenu
-from .bootloader.bootloader_menu import BootloaderMenu
 from .configuration import ConfigStore
 from .hardware import SysInfo
 from .interactions.general_conf import (
@@ -26,7 +23,6 @@ from .interactions.general_conf import (
 )
 from .interactions.system_conf import select_firmware, select_kernel, select_swap
 from .menu.abstract_menu import CONFIG_KEY, AbstractMenu
-from .menu.locale_menu import LocaleMenu
 from .models.bootloader import Bootloader, BootloaderConfiguration
 from .models.firmware import FirmwareConfiguration, FirmwareType
 from .models.locale import LocaleConfiguration
@@ -35,14 +31,56 @@ from .models.profile import ProfileConfiguration
 from .network.network_menu import select_network
 from .output import FormattedOutput
 from .pm.config import PacmanConfig
-from .pm.mirrors import PMenu
 
 if TYPE_CHECKING:
+	from collections.abc import Callable
+
 	from archinstoo.lib.models.authentication import AuthenticationConfiguration
 
 	from .args import ArchConfig
 	from .models.mirrors import PacmanConfiguration
 
+type _Preview = Callable[[GlobalMenu, MenuItem], str | None]
+
+_KERNEL_HEADERS_PROMPT = 'Install kernel headers?\n\nUseful for building out-of-tree drivers or DKMS modules,\nespecially for non-standard kernel variants.\n'
+
+# action-less items are never mutated by a menu, so the abort and theme
+# pickers can share them across calls the same way MenuItem.yes()/no() are
+_ABORT_ITEMS = (
+	MenuItem(text='save selections abort', value='save_abort'),
+	MenuItem(text='exit delete selection', value='abort_only'),
+	MenuItem(text='cancel abort', value='cancel'),
+)
+
+_THEME_MODE_ITEMS = tuple(MenuItem(text=mode.capitalize(), value=mode) for mode in ('dark', 'light'))
+_THEME_ACCENT_ITEMS = tuple(MenuItem(text=accent.capitalize(), value=accent) for accent in ('cyan', 'green', 'red', 'orange', 'blue', 'magenta'))
+
+
+def _on_off(flag: bool) -> str:
+	return 'Enabled' if flag else 'Disabled'
+
+
+def _versioned_preview(render: _Preview) -> _Preview:
+	# reuse a rendered preview until the item group version moves: these sort,
+	# slice or tabulate the whole value on every redraw otherwise
+	@wraps(render)
+	def wrapper(self: GlobalMenu, item: MenuItem) -> str | None:
+		version = self._item_group.version
+		cached = self._preview_cache.get(render.__name__)
+
+		if cached is not None and cached[0] == version:
+			return cached[1]
+
+		output = render(self, item)
+		self._preview_cache[render.__name__] = (version, output)
+		return output
+
+	return wrapper
+
+
+def _titled_section(title: str, body: str) -> str:
+	return f'{title}\n{"-" * len(title)}\n{body}'
+
 
 class GlobalMenu(AbstractMenu[None]):
 	def __init__(
@@ -57,6 +95,10 @@ class GlobalMenu(AbstractMenu[None]):
 		self._skip_auth = skip_auth
 		self._advanced = advanced
 		self._uefi = SysInfo.has_uefi()
+		# group version -> (missing configs, bootloader errors)
+		self._validation_cache: tuple[int, list[str], list[str]] | None = None
+		# preview name -> (group version, rendered output)
+		self._preview_cache: dict[str, tuple[int, str | None]] = {}
 		menu_options = self._get_menu_options()
 
 		self._item_group = MenuItemGroup(
@@ -65,6 +107,8 @@ class GlobalMenu(AbstractMenu[None]):
 			checkmarks=True,
 		)
 
+		self._mandatory_items = self._collect_mandatory_items()
+
 		super().__init__(self._item_group, config=arch_config)
 
 		# make the abort menu (save / abort / cancel) reachable via Ctrl+Q from any submenu
@@ -238,50 +282,55 @@ class GlobalMenu(AbstractMenu[None]):
 		auth_config: AuthenticationConfiguration | None = item.value
 		profile_config: ProfileConfiguration | None = self._item_group.find_by_key('profile_config').value
 
-		def check(s: str) -> bool:
-			item = self._item_group.find_by_key(s)
-			return item.has_value()
-
-		missing = set()
+		# every entry is distinct, so a plain list keeps them in menu order
+		missing: list[str] = []
 
 		if not self._skip_auth and (auth_config is None or auth_config.root_enc_password is None) and not self._has_elevated_users():
-			missing.add(
+			missing.append(
 				'Either root-password or at least 1 user with elevated privileges must be specified',
 			)
 
 		if profile_config and profile_config.greeter == GreeterType.Sddm and not (auth_config and auth_config.users):
-			missing.add('SDDM requires at least one regular user to log in')
+			missing.append('SDDM requires at least one regular user to log in')
 
 		aur_packages_item = self._item_group.find_by_key('aur_packages')
 		if aur_packages_item.has_value() and aur_packages_item.value:
 			from archinstoo.lib.models.authentication import PrivilegeEscalation
 
 			if not auth_config or auth_config.privilege_escalation == PrivilegeEscalation.Run0:
-				missing.add('AUR packages require Sudo or Doas privilege escalation (Run0 requires booted environment)')
+				missing.append('AUR packages require Sudo or Doas privilege escalation (Run0 requires booted environment)')
+
+		missing.extend(item.text for item in self._mandatory_items if not item.has_value())
+
+		return missing
 
-		for item in self._item_group.items:
-			if item.mandatory:
-				if item.key is None:
-					raise RuntimeError(f'Mandatory menu item {item.text!r} has no key')
-				if not check(item.key):
-					missing.add(item.text)
+	def _collect_mandatory_items(self) -> tuple[MenuItem, ...]:
+		# all items, not the filtered view: a search must not hide a missing entry
+		mandatory = tuple(item for item in self._item_group._menu_items if item.mandatory)
 
-		return list(missing)
+		for item in mandatory:
+			if item.key is None:
+				raise RuntimeError(f'Mandatory menu item {item.text!r} has no key')
+
+		return mandatory
+
+	@override
+	def set_mandatory(self, key: str, mandatory: bool) -> None:
+		super().set_mandatory(key, mandatory)
+		self._mandatory_items = self._collect_mandatory_items()
 
 	@override
 	def _is_config_valid(self) -> bool:
 		# Checks the validity of the current configuration.
+		# Always validated fresh: this gates the install, and a value mutated in
+		# place without a version bump must not slip through on a cached answer.
+		# The bootloader check walks every partition, skip it once anything is missing
 		return not (self._missing_configs() or self._validate_bootloader())
 
 	def _select_theme(self, preset: object | None = None) -> object | None:
 		# Select a theme for the TUI (session-only, not persisted).
 		# Select mode (dark/light)
-		mode_items = [
-			MenuItem(text='Dark', value='dark'),
-			MenuItem(text='Light', value='light'),
-		]
-
-		mode_group = MenuItemGroup(mode_items, sort_items=False)
+		mode_group = MenuItemGroup(list(_THEME_MODE_ITEMS), sort_items=False)
 		mode_group.set_focus_by_value(Tui._mode)
 
 		mode_result = SelectMenu[str](
@@ -295,16 +344,7 @@ class GlobalMenu(AbstractMenu[None]):
 			Tui.set_mode(mode)
 
 		# Select accent color
-		accent_items = [
-			MenuItem(text='Cyan', value='cyan'),
-			MenuItem(text='Green', value='green'),
-			MenuItem(text='Red', value='red'),
-			MenuItem(text='Orange', value='orange'),
-			MenuItem(text='Blue', value='blue'),
-			MenuItem(text='Magenta', value='magenta'),
-		]
-
-		accent_group = MenuItemGroup(accent_items, sort_items=False)
+		accent_group = MenuItemGroup(list(_THEME_ACCENT_ITEMS), sort_items=False)
 		accent_group.set_focus_by_value(Tui._accent)
 
 		accent_result = SelectMenu[str](
@@ -329,12 +369,18 @@ class GlobalMenu(AbstractMenu[None]):
 		return f'Theme: {Tui._mode.capitalize()} / {Tui._accent.capitalize()}'
 
 	def _select_applications(self, preset: ApplicationConfiguration | None) -> ApplicationConfiguration | None:
+		from .applications.application_menu import ApplicationMenu
+
 		return ApplicationMenu(preset, advanced=self._advanced).run()
 
 	def _select_authentication(self, preset: AuthenticationConfiguration | None) -> AuthenticationConfiguration | None:
+		from .authentication.authentication_menu import AuthenticationMenu
+
 		return AuthenticationMenu(preset).run()
 
 	def _locale_selection(self, preset: LocaleConfiguration) -> LocaleConfiguration:
+		from .menu.locale_menu import LocaleMenu
+
 		return LocaleMenu(preset).run()
 
 	def _prev_locale(self, item: MenuItem) -> str:
@@ -343,49 +389,47 @@ class GlobalMenu(AbstractMenu[None]):
 			config = LocaleConfiguration.default()
 		return config.preview()
 
+	@_versioned_preview
 	def _prev_network_config(self, item: MenuItem) -> str | None:
 		if item.value:
 			network_config: NetworkConfiguration = item.value
 			if network_config.type == NicType.MANUAL:
 				output = FormattedOutput.as_table(network_config.nics)
 			else:
-				output = f'{"Network configuration"}:\n{network_config.type.display_msg()}'
+				output = f'Network configuration:\n{network_config.type.display_msg()}'
 
 			return output
 		return None
 
+	@_versioned_preview
 	def _prev_additional_pkgs(self, item: MenuItem) -> str | None:
 		if item.value:
-			title = 'Additionals'
-			divider = '-' * len(title)
-			packages = '\n'.join(sorted(item.value))
-			return f'{title}\n{divider}\n{packages}'
+			return _titled_section('Additionals', '\n'.join(sorted(item.value)))
 		return None
 
+	@_versioned_preview
 	def _prev_aur_packages(self, item: MenuItem) -> str | None:
 		if item.value:
-			title = 'AUR packages'
-			divider = '-' * len(title)
-			packages = '\n'.join(sorted(item.value))
-			return f'{title}\n{divider}\n{packages}'
+			return _titled_section('AUR packages', '\n'.join(sorted(item.value)))
 		return None
 
+	@_versioned_preview
 	def _prev_authentication(self, item: MenuItem) -> str | None:
-		if item.value:
-			auth_config: AuthenticationConfiguration = item.value
-			output = ''
+		if not item.value:
+			return None
 
-			if auth_config.root_enc_password:
-				output += f'{"Root password"}: {auth_config.root_enc_password.hidden()}\n'
+		auth_config: AuthenticationConfiguration = item.value
+		lines: list[str] = []
 
-			if auth_config.users:
-				output += FormattedOutput.as_table(auth_config.users) + '\n'
-				priv_esc = auth_config.privilege_escalation.value if auth_config.privilege_escalation else 'None'
-				output += f'{"Privilege esc"}: {priv_esc}\n'
+		if auth_config.root_enc_password:
+			lines.append(f'Root password: {auth_config.root_enc_password.hidden()}')
 
-			return output
+		if auth_config.users:
+			lines.append(FormattedOutput.as_table(auth_config.users))
+			priv_esc = auth_config.privilege_escalation.value if auth_config.privilege_escalation else 'None'
+			lines.append(f'Privilege esc: {priv_esc}')
 
-		return None
+		return '\n'.join(lines)
 
 	def _validate_auth_config(self, auth_config: AuthenticationConfiguration) -> bool:
 		if not (auth_config.root_enc_password is not None or auth_config.users):
@@ -398,82 +442,56 @@ class GlobalMenu(AbstractMenu[None]):
 		return True
 
 	def _prev_applications(self, item: MenuItem) -> str | None:
-		if item.value:
-			app_config: ApplicationConfiguration = item.value
-			output = ''
-
-			if app_config.bluetooth_config:
-				output += f'{"Bluetooth"}: '
-				output += 'Enabled' if app_config.bluetooth_config.enabled else 'Disabled'
-				output += '\n'
-
-			if app_config.audio_config:
-				audio_config = app_config.audio_config
-				output += f'{"Audio"}: {audio_config.audio.value}'
-				output += '\n'
-
-			if app_config.print_service_config:
-				output += f'{"Print service"}: '
-				output += 'Enabled' if app_config.print_service_config.enabled else 'Disabled'
-				output += '\n'
-
-			if app_config.power_management_config:
-				power_management_config = app_config.power_management_config
-				output += f'{"Power management"}: {power_management_config.power_management.value}'
-				output += '\n'
-
-			if app_config.firewall_config:
-				firewall_config = app_config.firewall_config
-				output += f'{"Firewall"}: {firewall_config.firewall.value}'
-				output += '\n'
-
-			if app_config.management_config and app_config.management_config.tools:
-				tools = ', '.join([t.value for t in app_config.management_config.tools])
-				output += f'{"Management"}: {tools}'
-				output += '\n'
-
-			if app_config.monitor_config:
-				monitor_config = app_config.monitor_config
-				output += f'{"Monitor"}: {monitor_config.monitor.value}'
-				output += '\n'
-
-			if app_config.editor_config:
-				editor_config = app_config.editor_config
-				output += f'{"Editor"}: {editor_config.editor.value}'
-				output += '\n'
-
-			if app_config.security_config and app_config.security_config.tools:
-				tools = ', '.join([t.value for t in app_config.security_config.tools])
-				output += f'{"Security"}: {tools}'
-				output += '\n'
-
-			if app_config.development_config:
-				dev_config = app_config.development_config
-
-				if dev_config.language_config and dev_config.language_config.tools:
-					tools = ', '.join([t.value for t in dev_config.language_config.tools])
-					output += f'{"Languages"}: {tools}'
-					output += '\n'
-
-				if dev_config.devtool_config and dev_config.devtool_config.tools:
-					tools = ', '.join([t.value for t in dev_config.devtool_config.tools])
-					output += f'{"Build & Debug"}: {tools}'
-					output += '\n'
+		if not item.value:
+			return None
 
-			return output
+		app_config: ApplicationConfiguration = item.value
+		lines: list[str] = []
 
-		return None
+		if bt := app_config.bluetooth_config:
+			lines.append(f'Bluetooth: {_on_off(bt.enabled)}')
+
+		if audio := app_config.audio_config:
+			lines.append(f'Audio: {audio.audio.value}')
+
+		if printing := app_config.print_service_config:
+			lines.append(f'Print service: {_on_off(printing.enabled)}')
+
+		if power := app_config.power_management_config:
+			lines.append(f'Power management: {power.power_management.value}')
+
+		if firewall := app_config.firewall_config:
+			lines.append(f'Firewall: {firewall.firewall.value}')
+
+		if (management := app_config.management_config) and management.tools:
+			lines.append(f'Management: {", ".join(t.value for t in management.tools)}')
+
+		if monitor := app_config.monitor_config:
+			lines.append(f'Monitor: {monitor.monitor.value}')
+
+		if editor := app_config.editor_config:
+			lines.append(f'Editor: {editor.editor.value}')
+
+		if (security := app_config.security_config) and security.tools:
+			lines.append(f'Security: {", ".join(t.value for t in security.tools)}')
+
+		if dev_config := app_config.development_config:
+			if (languages := dev_config.language_config) and languages.tools:
+				lines.append(f'Languages: {", ".join(t.value for t in languages.tools)}')
+
+			if (devtools := dev_config.devtool_config) and devtools.tools:
+				lines.append(f'Build & Debug: {", ".join(t.value for t in devtools.tools)}')
+
+		return '\n'.join(lines) or None
 
 	def _prev_tz(self, item: MenuItem) -> str | None:
 		if item.value:
-			return f'{"Timezone"}: {item.value}'
+			return f'Timezone: {item.value}'
 		return None
 
 	def _prev_ntp(self, item: MenuItem) -> str | None:
 		if item.value is not None:
-			output = f'{"NTP"}: '
-			output += 'Enabled' if item.value else 'Disabled'
-			return output
+			return f'NTP: {_on_off(item.value)}'
 		return None
 
 	def _edit_custom_commands(self, preset: list[str]) -> list[str]:
@@ -487,16 +505,17 @@ class GlobalMenu(AbstractMenu[None]):
 		except KeyboardInterrupt:
 			return []
 
+	@_versioned_preview
 	def _prev_custom_commands(self, item: MenuItem) -> str | None:
 		commands: list[str] = item.value or []
 		if commands:
-			output = f'{"Commands"}: {len(commands)}\n'
+			lines = [f'Commands: {len(commands)}']
 			for i, cmd in enumerate(commands[:5]):
 				display = cmd[:50] + '...' if len(cmd) > 50 else cmd
-				output += f'  {i + 1}. {display}\n'
+				lines.append(f'  {i + 1}. {display}')
 			if len(commands) > 5:
-				output += f'  ... +{len(commands) - 5} more'
-			return output
+				lines.append(f'  ... +{len(commands) - 5} more')
+			return '\n'.join(lines)
 		return None
 
 	def _edit_sysctl(self, preset: list[str]) -> list[str]:
@@ -529,16 +548,17 @@ class GlobalMenu(AbstractMenu[None]):
 		except KeyboardInterrupt:
 			return []
 
+	@_versioned_preview
 	def _prev_sysctl(self, item: MenuItem) -> str | None:
 		entries: list[str] = item.value or []
 		if entries:
-			output = f'{"Entries"}: {len(entries)}\n'
+			lines = [f'Entries: {len(entries)}']
 			for line in entries[:5]:
 				display = line[:60] + '...' if len(line) > 60 else line
-				output += f'  {display}\n'
+				lines.append(f'  {display}')
 			if len(entries) > 5:
-				output += f'  ... +{len(entries) - 5} more'
-			return output
+				lines.append(f'  ... +{len(entries) - 5} more')
+			return '\n'.join(lines)
 		return None
 
 	# Sysctl load defaults option
@@ -617,44 +637,42 @@ class GlobalMenu(AbstractMenu[None]):
 
 		return lines
 
+	@_versioned_preview
 	def _prev_disk_config(self, item: MenuItem) -> str | None:
 		disk_layout_conf: DiskLayoutConfiguration | None = item.value
 
-		if disk_layout_conf:
-			output = f'Configuration type: {disk_layout_conf.config_type.display_msg()}' + '\n'
+		if not disk_layout_conf:
+			return None
 
-			if disk_layout_conf.config_type == DiskLayoutType.Pre_mount:
-				output += 'Mountpoint' + ': ' + str(disk_layout_conf.mountpoint)
+		lines = [f'Configuration type: {disk_layout_conf.config_type.display_msg()}']
 
-			if disk_layout_conf.lvm_config:
-				output += '{}: {}'.format('LVM configuration type', disk_layout_conf.lvm_config.config_type.display_msg()) + '\n'
+		if disk_layout_conf.config_type == DiskLayoutType.Pre_mount:
+			lines.append(f'Mountpoint: {disk_layout_conf.mountpoint}')
 
-			if disk_layout_conf.disk_encryption:
-				output += 'Disk encryption' + ': ' + disk_layout_conf.disk_encryption.encryption_type.type_to_text() + '\n'
+		if disk_layout_conf.lvm_config:
+			lines.append(f'LVM configuration type: {disk_layout_conf.lvm_config.config_type.display_msg()}')
 
-			if disk_layout_conf.btrfs_options:
-				btrfs_options = disk_layout_conf.btrfs_options
-				if btrfs_options.snapshot_config:
-					output += f'Btrfs snapshot type: {btrfs_options.snapshot_config.snapshot_type.display_name()}' + '\n'
+		if disk_layout_conf.disk_encryption:
+			lines.append(f'Disk encryption: {disk_layout_conf.disk_encryption.encryption_type.type_to_text()}')
 
-			return output
+		if (btrfs_options := disk_layout_conf.btrfs_options) and btrfs_options.snapshot_config:
+			lines.append(f'Btrfs snapshot type: {btrfs_options.snapshot_config.snapshot_type.display_name()}')
 
-		return None
+		return '\n'.join(lines)
 
 	def _prev_swap(self, item: MenuItem) -> str | None:
 		if item.value is not None:
-			output = f'{"Swap on zram"}: '
-			output += 'Enabled' if item.value.enabled else 'Disabled'
+			lines = [f'Swap on zram: {_on_off(item.value.enabled)}']
 			if item.value.enabled:
-				output += f'\n{"Compression algorithm"}: {item.value.algorithm.value}'
+				lines.append(f'Compression algorithm: {item.value.algorithm.value}')
 				if item.value.recomp_algorithm:
-					output += f'\n{"Recompression algorithm"}: {item.value.recomp_algorithm.value}'
-			return output
+					lines.append(f'Recompression algorithm: {item.value.recomp_algorithm.value}')
+			return '\n'.join(lines)
 		return None
 
 	def _prev_hostname(self, item: MenuItem) -> str | None:
 		if item.value is not None:
-			return f'{"Hostname"}: {item.value}'
+			return f'Hostname: {item.value}'
 		return None
 
 	def _select_kernel(self, preset: list[str]) -> list[str]:
@@ -663,16 +681,13 @@ class GlobalMenu(AbstractMenu[None]):
 
 		# Ask about kernel headers
 		current_headers = self._arch_config.kernel_headers
-		header_text = 'Install kernel headers?' + '\n\n'
-		header_text += 'Useful for building out-of-tree drivers or DKMS modules,' + '\n'
-		header_text += 'especially for non-standard kernel variants.' + '\n'
 
 		group = MenuItemGroup.yes_no()
 		group.set_focus_by_value(current_headers)
 
 		result = SelectMenu[bool](
 			group,
-			header=header_text,
+			header=_KERNEL_HEADERS_PROMPT,
 			columns=2,
 			orientation=Orientation.HORIZONTAL,
 			alignment=Alignment.CENTER,
@@ -691,21 +706,17 @@ class GlobalMenu(AbstractMenu[None]):
 
 	def _prev_kernel(self, item: MenuItem) -> str | None:
 		if item.value:
-			kernel = ', '.join(item.value)
-			output = f'{"Kernels"}: {kernel}\n'
-			status = 'Enabled' if self._arch_config.kernel_headers else 'Disabled'
-			output += f'{"Headers"}: {status}'
-			return output
+			return f'Kernels: {", ".join(item.value)}\nHeaders: {_on_off(self._arch_config.kernel_headers)}'
 		return None
 
 	def _prev_firmware(self, item: MenuItem) -> str | None:
 		config: FirmwareConfiguration | None = item.value
 		if not config:
 			return None
-		output = f'{"Firmware"}: {config.firmware_type.value}'
+		lines = [f'Firmware: {config.firmware_type.value}']
 		if config.firmware_type == FirmwareType.VENDOR and config.vendors:
-			output += '\n' + ', '.join(v.value for v in config.vendors)
-		return output
+			lines.append(', '.join(v.value for v in config.vendors))
+		return '\n'.join(lines)
 
 	def _prev_bootloader_config(self, item: MenuItem) -> str | None:
 		bootloader_config: BootloaderConfiguration | None = item.value
@@ -731,16 +742,16 @@ class GlobalMenu(AbstractMenu[None]):
 		efi_partition: PartitionModification | None = None
 
 		if disk_config := self._item_group.find_by_key('disk_config').value:
+			# one pass, first match per role wins, stop once every role is found
 			for layout in disk_config.device_modifications:
-				if root_partition := layout.get_root_partition():
-					break
-			for layout in disk_config.device_modifications:
-				if boot_partition := layout.get_boot_partition():
+				if root_partition is None:
+					root_partition = layout.get_root_partition()
+				if boot_partition is None:
+					boot_partition = layout.get_boot_partition()
+				if self._uefi and efi_partition is None:
+					efi_partition = layout.get_efi_partition()
+				if root_partition and boot_partition and (efi_partition or not self._uefi):
 					break
-			if self._uefi:
-				for layout in disk_config.device_modifications:
-					if efi_partition := layout.get_efi_partition():
-						break
 		else:
 			return ['No disk layout selected']
 
@@ -767,7 +778,7 @@ class GlobalMenu(AbstractMenu[None]):
 		if bootloader == Bootloader.Systemd and efi_partition and not boot_partition and not bootloader_config.uki:
 			errors.append('systemd-boot with ESP at /efi requires UKI or a separate XBOOTLDR /boot partition')
 
-		if bootloader in (Bootloader.Systemd, Bootloader.Efistub, Bootloader.Refind) and not SysInfo.has_uefi():
+		if bootloader in (Bootloader.Systemd, Bootloader.Efistub, Bootloader.Refind) and not self._uefi:
 			errors.append(f'{bootloader.display_name()} requires a UEFI system')
 
 		# Firmware reads the kernel directly from the boot partition, which must be FAT.
@@ -795,48 +806,58 @@ class GlobalMenu(AbstractMenu[None]):
 
 		return errors
 
+	def _cached_validation(self) -> tuple[list[str], list[str]]:
+		# the Install preview re-renders on every redraw while focused, but the
+		# answer only moves when an item value does
+		key = self._item_group.version
+
+		if self._validation_cache is None or self._validation_cache[0] != key:
+			self._validation_cache = (key, self._missing_configs(), self._validate_bootloader())
+
+		return self._validation_cache[1], self._validation_cache[2]
+
 	def _prev_install_invalid_config(self, item: MenuItem) -> str | None:
-		text = ''
+		missing, errors = self._cached_validation()
+		lines: list[str] = []
 
-		if missing := self._missing_configs():
-			text += 'Missing configurations:\n'
-			for m in missing:
-				text += f'- {m}\n'
+		if missing:
+			lines.append('Missing configurations:')
+			lines.extend(f'- {m}' for m in missing)
 
-		if errors := self._validate_bootloader():
-			text += 'Bad configurations:\n'
-			for e in errors:
-				text += f'- {e}\n'
+		if errors:
+			lines.append('Bad configurations:')
+			lines.extend(f'- {e}' for e in errors)
 
-		return text.rstrip('\n') or None
+		return '\n'.join(lines) or None
 
+	@_versioned_preview
 	def _prev_profile(self, item: MenuItem) -> str | None:
 		profile_config: ProfileConfiguration | None = item.value
 
-		if profile_config and profile_config.profiles:
-			output = 'Profiles' + ': '
-			profile_names = [p.name for p in profile_config.profiles]
-			output += ', '.join(profile_names) + '\n'
+		if not (profile_config and profile_config.profiles):
+			return None
 
-			# Show sub-selections for each profile
-			for profile in profile_config.profiles:
-				if sub_names := profile.current_selection_names():
-					output += f'  {profile.name}: ' + ', '.join(sub_names) + '\n'
+		lines = [f'Profiles: {", ".join(p.name for p in profile_config.profiles)}']
 
-			if profile_config.gfx_driver:
-				output += 'Graphics driver' + ': ' + profile_config.gfx_driver.display_name() + '\n'
+		# Show sub-selections for each profile
+		lines.extend(
+			f'  {profile.name}: {", ".join(sub_names)}' for profile in profile_config.profiles if (sub_names := profile.current_selection_names())
+		)
 
-			if profile_config.greeter:
-				output += 'Greeter' + ': ' + profile_config.greeter.value + '\n'
+		if profile_config.gfx_driver:
+			lines.append(f'Graphics driver: {profile_config.gfx_driver.display_name()}')
 
-			return output
+		if profile_config.greeter:
+			lines.append(f'Greeter: {profile_config.greeter.value}')
 
-		return None
+		return '\n'.join(lines)
 
 	def _select_disk_config(
 		self,
 		preset: DiskLayoutConfiguration | None = None,
 	) -> DiskLayoutConfiguration | None:
+		from .disk.disk_menu import DiskLayoutConfigurationMenu
+
 		bootloader_config: BootloaderConfiguration | None = self._item_group.find_by_key('bootloader_config').value
 		uki_enabled = bool(bootloader_config and bootloader_config.uki)
 		is_grub = bool(bootloader_config and bootloader_config.bootloader == Bootloader.Grub)
@@ -845,6 +866,7 @@ class GlobalMenu(AbstractMenu[None]):
 		# ends up on the unencrypted ESP
 		allow_auto_unlock = is_grub and not uki_enabled
 		bootloader = bootloader_config.bootloader if bootloader_config else None
+
 		return DiskLayoutConfigurationMenu(preset, allow_auto_unlock=allow_auto_unlock, bootloader=bootloader, advanced=self._advanced).run()
 
 	def _select_bootloader_config(
@@ -854,6 +876,8 @@ class GlobalMenu(AbstractMenu[None]):
 		if preset is None:
 			preset = BootloaderConfiguration.get_default(self._uefi, self._skip_boot)
 
+		from .bootloader.bootloader_menu import BootloaderMenu
+
 		return BootloaderMenu(preset, self._uefi, self._skip_boot).run()
 
 	@staticmethod
@@ -872,6 +896,8 @@ class GlobalMenu(AbstractMenu[None]):
 		return select_additional_packages(preset)
 
 	def _pacman_configuration(self, preset: PacmanConfiguration | None = None) -> PacmanConfiguration:
+		from .pm.mirrors import PMenu
+
 		pacman_configuration = PMenu(preset=preset).run()
 
 		needs_apply = pacman_configuration.optional_repositories or pacman_configuration.custom_repositories or pacman_configuration.pacman_options
@@ -893,50 +919,36 @@ class GlobalMenu(AbstractMenu[None]):
 
 		return pacman_configuration
 
+	@_versioned_preview
 	def _prev_pacman_config(self, item: MenuItem) -> str | None:
 		if not item.value:
 			return None
 
 		config: PacmanConfiguration = item.value
 
-		output = ''
+		sections: list[str] = []
 		if config.mirror_regions:
-			title = 'Selected mirror regions'
-			divider = '-' * len(title)
-			regions = config.region_names
-			output += f'{title}\n{divider}\n{regions}\n\n'
+			sections.append(_titled_section('Selected mirror regions', config.region_names))
 
 		if config.custom_servers:
-			title = 'Custom servers'
-			divider = '-' * len(title)
-			servers = config.custom_server_urls
-			output += f'{title}\n{divider}\n{servers}\n\n'
+			sections.append(_titled_section('Custom servers', config.custom_server_urls))
 
 		if config.optional_repositories:
-			title = 'Optional repositories'
-			divider = '-' * len(title)
-			repos = ', '.join([r.value for r in config.optional_repositories])
-			output += f'{title}\n{divider}\n{repos}\n\n'
+			sections.append(_titled_section('Optional repositories', ', '.join(r.value for r in config.optional_repositories)))
 
 		if config.custom_repositories:
-			title = 'Custom repositories'
-			table = FormattedOutput.as_table(config.custom_repositories)
-			output += f'{title}:\n\n{table}'
+			sections.append(f'Custom repositories:\n\n{FormattedOutput.as_table(config.custom_repositories)}')
 
-		return output.strip()
+		return '\n\n'.join(sections).strip()
 
 	def _handle_abort(self, preset: None) -> None:
-		items = []
 		# Only offer to save if meaningful config has been set
 		disk_config = self._item_group.find_by_key('disk_config').value
 		profile_config = self._item_group.find_by_key('profile_config').value
 		app_config = self._item_group.find_by_key('app_config').value
 
-		if disk_config is not None or profile_config is not None or app_config:
-			items.append(MenuItem(text='save selections abort', value='save_abort'))
-
-		items.append(MenuItem(text='exit delete selection', value='abort_only'))
-		items.append(MenuItem(text='cancel abort', value='cancel'))
+		offer_save = disk_config is not None or profile_config is not None or app_config
+		items = list(_ABORT_ITEMS if offer_save else _ABORT_ITEMS[1:])
 
 		group = MenuItemGroup(items)
 		group.focus_item = group.items[0]  # Focus on first option
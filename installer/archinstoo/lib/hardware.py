@@ -208,6 +208,43 @@ class _SysInfo:
 	def has_uefi(self) -> bool:
 		return self.efi_path.is_dir()
 
+	@cached_property
+	def is_vm(self) -> bool:
+		# systemd-detect-virt is a fork per call; the answer is fixed for the run
+		try:
+			result = SysCommand('systemd-detect-virt')
+			return b'none' not in b''.join(result).lower()
+		except SysCallError:
+			# present but reported an error, treat as bare metal
+			return False
+		except RequirementError:
+			# non-systemd host (e.g. alpine): binary absent, fall back to DMI
+			pass
+
+		# xen exposes its type here, and the DMI vendor names the hypervisor for
+		# kvm/qemu/vmware/virtualbox/hyper-v on anything with a sysfs
+		if Path('/sys/hypervisor/type').exists():
+			return True
+
+		vendor = Path('/sys/class/dmi/id/sys_vendor')
+		if vendor.exists():
+			known = (
+				'qemu',
+				'kvm',
+				'vmware',
+				'virtualbox',
+				'innotek',
+				'microsoft corporation',
+				'xen',
+				'bochs',
+				'parallels',
+				'bhyve',
+			)
+			text = vendor.read_text().strip().lower()
+			return any(v in text for v in known)
+
+		return False
+
 	@cached_property
 	def efi_bitness(self) -> int | None:
 		try:
@@ -430,39 +467,7 @@ class SysInfo:
 
 	@staticmethod
 	def is_vm() -> bool:
-		try:
-			result = SysCommand('systemd-detect-virt')
-			return b'none' not in b''.join(result).lower()
-		except SysCallError:
-			# present but reported an error, treat as bare metal
-			return False
-		except RequirementError:
-			# non-systemd host (e.g. alpine): binary absent, fall back to DMI
-			pass
-
-		# xen exposes its type here, and the DMI vendor names the hypervisor for
-		# kvm/qemu/vmware/virtualbox/hyper-v on anything with a sysfs
-		if Path('/sys/hypervisor/type').exists():
-			return True
-
-		vendor = Path('/sys/class/dmi/id/sys_vendor')
-		if vendor.exists():
-			known = (
-				'qemu',
-				'kvm',
-				'vmware',
-				'virtualbox',
-				'innotek',
-				'microsoft corporation',
-				'xen',
-				'bochs',
-				'parallels',
-				'bhyve',
-			)
-			text = vendor.read_text().strip().lower()
-			return any(v in text for v in known)
-
-		return False
+		return _sys_info.is_vm
 
 	@staticmethod
 	def requires_sof_fw() -> bool:
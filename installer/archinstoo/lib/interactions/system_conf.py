@@ -8,6 +8,11 @@ from archinstoo.lib.tui.menu_item import MenuItem, MenuItemGroup
 from archinstoo.lib.tui.result import ResultType
 from archinstoo.lib.tui.types import Alignment, FrameProperties, Orientation
 
+# the same items from_enum would build; action-less, so no menu mutates them
+# and each call only needs a fresh group around them
+_KERNEL_ITEMS = tuple(MenuItem(kernel.value, value=kernel) for kernel in Kernel)
+_ZRAM_ALGORITHM_ITEMS = tuple(MenuItem(algo.value, value=algo) for algo in ZramAlgorithm)
+
 
 def select_kernel(preset: list[str] = []) -> list[str]:
 	# Asks the user to select a kernel for system.
@@ -16,7 +21,8 @@ def select_kernel(preset: list[str] = []) -> list[str]:
 	# :rtype: string
 	preset_kernels = [Kernel(p) for p in preset if p in Kernel._value2member_map_]
 
-	group = MenuItemGroup.from_enum(Kernel, sort_items=True, preset=preset_kernels)
+	group = MenuItemGroup(list(_KERNEL_ITEMS), sort_items=True)
+	group.set_selected_by_value(preset_kernels)
 	group.set_default_by_value(DEFAULT_KERNEL)
 	group.set_focus_by_value(DEFAULT_KERNEL)
 
@@ -63,7 +69,7 @@ def select_swap(preset: ZramConfiguration = ZramConfiguration(enabled=True)) ->
 				return ZramConfiguration(enabled=False)
 
 			# Ask for compression algorithm
-			algo_group = MenuItemGroup.from_enum(ZramAlgorithm, sort_items=False)
+			algo_group = MenuItemGroup(list(_ZRAM_ALGORITHM_ITEMS), sort_items=False)
 			algo_group.set_default_by_value(ZramAlgorithm.Default)
 			algo_group.set_focus_by_value(preset.algorithm)
 
@@ -3,6 +3,7 @@ import os
 import re
 import shutil
 import xml.etree.ElementTree as ET
+from functools import cache, wraps
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,9 +14,27 @@ from archinstoo.lib.utils.env import Os
 from archinstoo.lib.utils.net import fetch_data_from_url
 
 if TYPE_CHECKING:
-	from collections.abc import Iterable
+	from collections.abc import Callable, Collection, Iterable
 
 
+def _cache_found[T: Collection[str]](lister: Callable[[], T]) -> Callable[[], T]:
+	# functools.cache for the zero-arg listers below (localectl/timedatectl
+	# spawn, disk scan or network fetch per call), except an empty answer is
+	# not kept: an offline fetch fallback gets retried once the network is up
+	found: list[T] = []
+
+	@wraps(lister)
+	def wrapper() -> T:
+		if found:
+			return found[0]
+		if result := lister():
+			found.append(result)
+		return result
+
+	return wrapper
+
+
+@_cache_found
 def list_keyboard_languages() -> list[str]:
 	try:
 		out = SysCommand(
@@ -43,7 +62,13 @@ def _scan_keymaps() -> list[str]:
 		prefix = Path(loadkeys).resolve().parent.parent
 		roots += [prefix / 'share/kbd/keymaps', prefix / 'share/keymaps']
 
-	names = {p.name.removesuffix('.gz').removesuffix('.map') for root in roots if root.is_dir() for p in root.rglob('*.map*')}
+	# on an FHS host the loadkeys prefix is /usr, naming the same trees again;
+	# walk each real directory once
+	unique = {root.resolve() for root in roots if root.is_dir()}
+	names: set[str] = set()
+	for root in unique:
+		for _, _, files in os.walk(root):
+			names.update(fn.removesuffix('.gz').removesuffix('.map') for fn in files if fn.endswith(('.map', '.map.gz')))
 	return sorted(names)
 
 
@@ -116,11 +141,17 @@ def _fetch_glibc_supported() -> list[str]:
 	return _generatable(locales)
 
 
+@cache
+def _read_supported(path: Path) -> list[str]:
+	# keyed on the path so a swapped SUPPORTED source reads fresh; one read()
+	# and splitlines() instead of a buffered readline per entry
+	return _generatable(line.rstrip() for line in path.read_text().splitlines())
+
+
 def list_locales() -> list[str]:
 	# glibc hosts enumerate from i18n/SUPPORTED
 	if _SUPPORTED_PATH.is_file():
-		with _SUPPORTED_PATH.open() as file:
-			return _generatable(line.rstrip() for line in file)
+		return _read_supported(_SUPPORTED_PATH)
 
 	# non-glibc host (musl/alpine): no SUPPORTED on disk, pull the canonical
 	# list glibc ships upstream so the target (Arch/glibc) choices are accurate
@@ -173,8 +204,13 @@ def list_locale_encodings(sys_lang: str) -> list[str]:
 	return sorted(scoped, key=lambda enc: (enc != 'UTF-8', enc))
 
 
+@_cache_found
+def _keymaps_lower() -> frozenset[str]:
+	return frozenset(language.lower() for language in list_keyboard_languages())
+
+
 def verify_keyboard_layout(layout: str) -> bool:
-	return any(layout.lower() == language.lower() for language in list_keyboard_languages())
+	return layout.lower() in _keymaps_lower()
 
 
 def _localectl_keymap(subcmd: str) -> list[str]:
@@ -189,17 +225,26 @@ def _localectl_keymap(subcmd: str) -> list[str]:
 	)
 
 
+# the parsed registry once a fetch succeeds: layouts, models, options and every
+# per-layout variant lookup read the same document
+_x11_registry: list[ET.Element] = []
+
+
 def _fetch_x11_registry() -> ET.Element | None:
 	# upstream xkeyboard-config rules registry; used when localectl is missing
 	# (non-systemd hosts: alpine, foreign hosts, ...)
+	if _x11_registry:
+		return _x11_registry[0]
 	try:
 		text = fetch_data_from_url(_X11_BASE_XML_URL)
 	except ValueError:
 		return None
 	try:
-		return ET.fromstring(text)  # noqa: S314 - trusted xkeyboard-config source over https
+		root = ET.fromstring(text)  # noqa: S314 - trusted xkeyboard-config source over https
 	except ET.ParseError:
 		return None
+	_x11_registry.append(root)
+	return root
 
 
 def _fetch_x11_names(xpath: str) -> list[str]:
@@ -209,6 +254,7 @@ def _fetch_x11_names(xpath: str) -> list[str]:
 	return [name.text for name in root.findall(xpath) if name.text]
 
 
+@_cache_found
 def list_x11_keyboard_languages() -> list[str]:
 	try:
 		if out := _localectl_keymap('list-x11-keymap-layouts'):
@@ -219,6 +265,7 @@ def list_x11_keyboard_languages() -> list[str]:
 	return _fetch_x11_names('./layoutList/layout/configItem/name')
 
 
+@_cache_found
 def list_x11_keyboard_models() -> list[str]:
 	try:
 		if out := _localectl_keymap('list-x11-keymap-models'):
@@ -228,6 +275,7 @@ def list_x11_keyboard_models() -> list[str]:
 	return _fetch_x11_names('./modelList/model/configItem/name')
 
 
+@_cache_found
 def list_x11_keyboard_options() -> list[str]:
 	try:
 		if out := _localectl_keymap('list-x11-keymap-options'):
@@ -261,8 +309,13 @@ def _fetch_x11_variants(layout: str) -> list[str]:
 	return []
 
 
+@_cache_found
+def _x11_layouts_lower() -> frozenset[str]:
+	return frozenset(language.lower() for language in list_x11_keyboard_languages())
+
+
 def verify_x11_keyboard_layout(layout: str) -> bool:
-	return any(layout.lower() == language.lower() for language in list_x11_keyboard_languages())
+	return layout.lower() in _x11_layouts_lower()
 
 
 def get_kb_layout() -> str:
@@ -278,12 +331,9 @@ def get_kb_layout() -> str:
 	except Exception:
 		return ''
 
-	vcline = ''
-	for line in lines:
-		if 'VC Keymap: ' in line:
-			vcline = line
-
-	if vcline == '':
+	# localectl prints the VC Keymap line once; stop at it
+	vcline = next((line for line in lines if 'VC Keymap: ' in line), '')
+	if not vcline:
 		return ''
 
 	layout = vcline.split(': ')[1]
@@ -315,16 +365,14 @@ def set_kb_layout(locale: str) -> bool:
 
 
 # disk fonts are gz-compressed (.psfu.gz); the upstream repo ships them raw
-_FONT_SUFFIXES = ('.psfu.gz', '.psf.gz', '.gz', '.psfu', '.psf')
+_FONT_SUFFIX_RE = re.compile(r'\.(?:psfu\.gz|psf\.gz|gz|psfu|psf)$')
 
 
 def _strip_font_suffix(name: str) -> str:
-	for suffix in _FONT_SUFFIXES:
-		if name.endswith(suffix):
-			return name[: -len(suffix)]
-	return name
+	return _FONT_SUFFIX_RE.sub('', name, count=1)
 
 
+@_cache_found
 def list_console_fonts() -> list[str]:
 	font_dir = Path('/usr/share/kbd/consolefonts')
 
@@ -343,6 +391,7 @@ def _fetch_kbd_fonts() -> list[str]:
 	return sorted(fonts, key=lambda x: (len(x), x))
 
 
+@_cache_found
 def list_timezones() -> list[str]:
 	try:
 		out = SysCommand(
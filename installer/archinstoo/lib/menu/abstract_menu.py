@@ -53,6 +53,8 @@ class AbstractMenu[ValueT]:
 				if config_value is not None:
 					item.value = config_value
 
+		self._menu_item_group.mark_changed()
+
 	def _reset_items(self) -> None:
 		for item in self._menu_item_group._menu_items:
 			if item.key and not item.key.startswith(CONFIG_KEY):
@@ -61,6 +63,8 @@ class AbstractMenu[ValueT]:
 				else:
 					item.value = None
 
+		self._menu_item_group.mark_changed()
+
 	def sync_all_to_config(self) -> None:
 		for item in self._menu_item_group._menu_items:
 			if item.key:
@@ -71,6 +75,7 @@ class AbstractMenu[ValueT]:
 		if item is None:
 			raise ValueError(f'No selector found: {key}')
 		item.mandatory = mandatory
+		self._menu_item_group.mark_changed()
 
 	def set_enabled(self, key: str, enabled: bool) -> None:
 		# the __config__ is associated with multiple items
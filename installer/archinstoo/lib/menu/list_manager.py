@@ -9,6 +9,13 @@ from archinstoo.lib.tui.types import Alignment
 
 
 class ListManager[ValueT]:
+	# fixed labels, shared by every list rather than set up per instance
+	_confirm_action = 'Confirm and exit'
+	_cancel_action = 'Cancel'
+	_reset_action = '_reset_'
+	_back_action = 'Back'
+	_terminate_actions = (_confirm_action, _cancel_action)
+
 	def __init__(
 		self,
 		entries: list[ValueT],
@@ -32,19 +39,14 @@ class ListManager[ValueT]:
 		#
 		# :param allow_reset: if True, Ctrl+C will reset/clear the selection
 		# type param: bool
-		self._original_data = copy.deepcopy(entries)
+		# handlers edit the working copy in place, never the caller's entries,
+		# so those are handed back as-is on cancel without a second deepcopy
+		self._original_data = list(entries)
 		self._data = copy.deepcopy(entries)
 
 		self._prompt = prompt
 		self._allow_reset = allow_reset
 
-		self._separator = ''
-		self._confirm_action = 'Confirm and exit'
-		self._cancel_action = 'Cancel'
-		self._reset_action = '_reset_'
-		self._back_action = 'Back'
-
-		self._terminate_actions = [self._confirm_action, self._cancel_action]
 		self._base_actions = base_actions
 		self._sub_menu_actions = sub_menu_actions
 
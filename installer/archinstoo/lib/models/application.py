@@ -166,7 +166,7 @@ class ApplicationSerialization(TypedDict):
 	development_config: NotRequired[DevelopmentConfigSerialization]
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioConfiguration:
 	audio: Audio
 
@@ -182,7 +182,7 @@ class AudioConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class BluetoothConfiguration:
 	enabled: bool
 
@@ -194,7 +194,7 @@ class BluetoothConfiguration:
 		return cls(arg['enabled'])
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerManagementConfiguration:
 	power_management: PowerManagement
 
@@ -210,7 +210,7 @@ class PowerManagementConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintServiceConfiguration:
 	enabled: bool
 
@@ -222,7 +222,7 @@ class PrintServiceConfiguration:
 		return cls(arg['enabled'])
 
 
-@dataclass
+@dataclass(slots=True)
 class FirewallConfiguration:
 	firewall: Firewall
 
@@ -238,7 +238,7 @@ class FirewallConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagementConfiguration:
 	tools: list[Management]
 
@@ -254,7 +254,7 @@ class ManagementConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitorConfiguration:
 	monitor: Monitor
 
@@ -270,7 +270,7 @@ class MonitorConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class EditorConfiguration:
 	editor: Editor
 
@@ -286,7 +286,7 @@ class EditorConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityConfiguration:
 	tools: list[Security]
 
@@ -302,7 +302,7 @@ class SecurityConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageConfiguration:
 	tools: list[Language]
 
@@ -318,7 +318,7 @@ class LanguageConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class DevToolConfiguration:
 	tools: list[DevTool]
 
@@ -334,7 +334,7 @@ class DevToolConfiguration:
 		)
 
 
-@dataclass
+@dataclass(slots=True)
 class DevelopmentConfiguration:
 	language_config: LanguageConfiguration | None = None
 	devtool_config: DevToolConfiguration | None = None
@@ -357,7 +357,7 @@ class DevelopmentConfiguration:
 		return config
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZramConfiguration:
 	enabled: bool
 	algorithm: ZramAlgorithm = ZramAlgorithm.Default
@@ -375,7 +375,7 @@ class ZramConfiguration:
 		return cls(enabled=enabled, algorithm=ZramAlgorithm(algo), recomp_algorithm=recomp_algo)
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationConfiguration:
 	bluetooth_config: BluetoothConfiguration | None = None
 	audio_config: AudioConfiguration | None = None
@@ -11,11 +11,13 @@ class PrivilegeEscalation(Enum):
 	Run0 = 'run0'
 
 	def packages(self) -> list[str]:
-		return {
-			PrivilegeEscalation.Sudo: ['sudo'],
-			PrivilegeEscalation.Doas: ['opendoas'],
-			PrivilegeEscalation.Run0: ['polkit'],  # run0 is part of systemd, just needs polkit
-		}[self]
+		match self:
+			case PrivilegeEscalation.Sudo:
+				return ['sudo']
+			case PrivilegeEscalation.Doas:
+				return ['opendoas']
+			case PrivilegeEscalation.Run0:
+				return ['polkit']  # run0 is part of systemd, just needs polkit
 
 
 class AuthenticationSerialization(TypedDict):
@@ -12,6 +12,10 @@ from archinstoo.lib.models.packages import Repository
 from archinstoo.lib.output import debug
 from archinstoo.lib.utils.net import DownloadTimer, ping
 
+# bytes of the repo db a speed probe reads, and the read size it streams them in
+_SPEEDTEST_SAMPLE = 2 * 1024 * 1024
+_SPEEDTEST_CHUNK = 64 * 1024
+
 
 def _parse_datetime(value: str | datetime.datetime | None) -> datetime.datetime | None:
 	# Parse ISO datetime string, handling Z suffix and already-parsed values.
@@ -53,7 +57,7 @@ class _MirrorList(TypedDict):
 	check_frequency: NotRequired[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class MirrorStatusEntryV3:
 	url: str
 	protocol: str
@@ -140,7 +144,11 @@ class MirrorStatusEntryV3:
 					# phase too, not just read(). Else a multi-homed unreachable mirror walks every
 					# dead address at 5s each (Errno 101 / pre-403 stalls) before skipping.
 					with DownloadTimer(timeout=5) as timer, urllib.request.urlopen(req, None, 5) as handle:  # noqa: S310
-						size = len(handle.read())
+						# count bytes as they stream in rather than buffering the db, and
+						# stop at a fixed sample so every mirror is timed on the same work
+						size = 0
+						while size < _SPEEDTEST_SAMPLE and (chunk := handle.read(_SPEEDTEST_CHUNK)):
+							size += len(chunk)
 
 					if timer.time is None:
 						raise RuntimeError('DownloadTimer exited without recording time')
@@ -177,7 +185,7 @@ class MirrorStatusEntryV3:
 		return self._latency
 
 
-@dataclass
+@dataclass(slots=True)
 class MirrorStatusListV3:
 	cutoff: int
 	last_check: datetime.datetime
@@ -207,7 +215,7 @@ class MirrorStatusListV3:
 		return cls.from_dict(json.loads(data))
 
 
-@dataclass
+@dataclass(slots=True)
 class MirrorRegion:
 	name: str
 	urls: list[str]
@@ -253,7 +261,7 @@ class _CustomRepositorySerialization(TypedDict):
 	sign_option: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomRepository:
 	name: str
 	url: str
@@ -289,7 +297,7 @@ class CustomRepository:
 		]
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomServer:
 	url: str
 
@@ -90,7 +90,6 @@ class FormattedOutput:
 			filter_list = list(column_width.keys())
 
 		# create the header lines
-		output = ''
 		key_list = []
 		for key in filter_list:
 			width = column_width[key]
@@ -101,8 +100,8 @@ class FormattedOutput:
 
 			key_list.append(unicode_ljust(key, width))
 
-		output += ' | '.join(key_list) + '\n'
-		output += '-' * len(output) + '\n'
+		header = ' | '.join(key_list)
+		lines = [header, '-' * (len(header) + 1)]
 
 		# create the data lines
 		for record in raw_data:
@@ -119,9 +118,11 @@ class FormattedOutput:
 				else:
 					obj_data.append(unicode_ljust(str(value), width))
 
-			output += ' | '.join(obj_data) + '\n'
+			lines.append(' | '.join(obj_data))
 
-		return output
+		# collected per line and joined once rather than grown with +=
+		lines.append('')
+		return '\n'.join(lines)
 
 
 def restore_perms(path: Path, recursive: bool = False) -> None:
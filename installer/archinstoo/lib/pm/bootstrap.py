@@ -37,6 +37,9 @@ _PACMAN_DIRS = (
 	Path('/var/cache/pacman/pkg'),
 )
 
+# any section header other than [options] means the conf already declares a repo
+_REPO_SECTION = re.compile(r'^\[(?!options\b)[\w-]+\]', re.MULTILINE)
+
 
 class _Sources(NamedTuple):
 	pacman_conf: str
@@ -59,7 +62,7 @@ def _has_repos() -> bool:
 	# True only if pacman.conf already declares a real repo, not just [options].
 	if not PACMAN_CONF.exists():
 		return False
-	return bool(re.search(r'^\[(?!options\b)[\w-]+\]', PACMAN_CONF.read_text(), re.MULTILINE))
+	return bool(_REPO_SECTION.search(PACMAN_CONF.read_text()))
 
 
 def _build_mirrorlist() -> str:
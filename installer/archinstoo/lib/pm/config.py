@@ -95,6 +95,12 @@ _STANDARD_REPOS = {
 	'community-testing',
 }
 
+# pacman.conf line patterns used by PacmanConfig.apply()
+_COMMENT_PREFIX = re.compile(r'^#\s*')
+_COMMENTED_SECTION = re.compile(r'^#\s*\[(.*)\]')
+_CORE_SECTION = re.compile(r'^\[core\]')
+_SECTION_NAME = re.compile(r'^\[([^\]]+)\]', re.MULTILINE)
+
 if TYPE_CHECKING:
 	from pathlib import Path
 
@@ -129,48 +135,51 @@ class PacmanConfig:
 		if not self._repositories and not self._custom_repositories and not self._misc_options:
 			return
 
-		repos_to_enable = []
+		repos_to_enable: set[str] = set()
 		for repo in self._repositories:
 			if repo == Repository.Testing:
-				repos_to_enable.extend(['core-testing', 'extra-testing', 'multilib-testing'])
+				repos_to_enable.update(['core-testing', 'extra-testing', 'multilib-testing'])
 			else:
-				repos_to_enable.append(repo.value)
+				repos_to_enable.add(repo.value)
 
-		content = PACMAN_CONF.read_text().splitlines(keepends=True)
+		original = PACMAN_CONF.read_text()
+		content = original.splitlines(keepends=True)
 		options_found: set[str] = set()
 		last_opt_row = 0
 
+		# one alternation for all misc options, compiled once per apply
+		options_re = re.compile(rf'^#?\s*({"|".join(map(re.escape, self._misc_options))})\b') if self._misc_options else None
+
 		for row, line in enumerate(content):
 			# Uncomment misc options (Color, ILoveCandy, etc.)
-			for opt in self._misc_options:
-				if re.match(rf'^#?\s*{opt}\b', line):
-					options_found.add(opt)
-					last_opt_row = row
-					if line.lstrip().startswith('#'):
-						content[row] = re.sub(r'^#\s*', '', line)
-					break
+			if options_re and (opt_match := options_re.match(line)):
+				options_found.add(opt_match.group(1))
+				last_opt_row = row
+				if line.lstrip().startswith('#'):
+					content[row] = _COMMENT_PREFIX.sub('', line)
 
 			# Check if this is a commented repository section that needs to be enabled
-			match = re.match(r'^#\s*\[(.*)\]', line)
+			match = _COMMENTED_SECTION.match(line)
 
 			if match and match.group(1) in repos_to_enable:
 				# uncomment the repository section line, properly removing # and any spaces
-				content[row] = re.sub(r'^#\s*', '', line)
+				content[row] = _COMMENT_PREFIX.sub('', line)
 
 				# also uncomment the next line (Include statement) if it exists and is commented
 				if row + 1 < len(content) and content[row + 1].lstrip().startswith('#'):
-					content[row + 1] = re.sub(r'^#\s*', '', content[row + 1])
+					content[row + 1] = _COMMENT_PREFIX.sub('', content[row + 1])
 
 		for opt in set(self._misc_options) - options_found:
 			content.insert(last_opt_row + 1, f'{opt}\n')
 
 		# Append custom repositories (skip if already exists)
-		content_str = ''.join(content)
-		core_idx = next((i for i, line in enumerate(content) if re.match(r'^\[core\]', line)), None)
+		existing = set(_SECTION_NAME.findall(''.join(content)))
+		core_idx = next((i for i, line in enumerate(content) if _CORE_SECTION.match(line)), None)
 
 		for custom in self._custom_repositories:
-			if f'[{custom.name}]' in content_str:
+			if custom.name in existing:
 				continue
+			existing.add(custom.name)
 			if custom.url.startswith('file://'):
 				# Insert before [core] to give priority (mirrors ISOMOD_CACHE behaviour)
 				insert_at = core_idx if core_idx is not None else len(content)
@@ -185,9 +194,10 @@ class PacmanConfig:
 				content.append(f'SigLevel = {custom.sign_check.value} {custom.sign_option.value}\n')
 				content.append(f'Server = {custom.url}\n')
 
-		# Host conf is snapshotted and restored on exit by guard_host_conf(); just write.
-		with PACMAN_CONF.open('w') as f:
-			f.writelines(content)
+		# Host conf is snapshotted and restored on exit by guard_host_conf(); just write,
+		# unless every repo and option was already enabled and the text is unchanged
+		if (updated := ''.join(content)) != original:
+			PACMAN_CONF.write_text(updated)
 
 	def persist(self) -> None:
 		has_changes = self._repositories or self._custom_repositories or self._misc_options
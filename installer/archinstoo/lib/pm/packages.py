@@ -1,21 +1,33 @@
 import contextlib
 from dataclasses import fields
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from archinstoo.lib.models.packages import AvailablePackage, LocalPackage
 from archinstoo.lib.output import debug
 from archinstoo.lib.pacman import Pacman
 
+if TYPE_CHECKING:
+	from collections.abc import Iterable, Iterator
+
+
+@lru_cache
+def _field_names(cls: type[AvailablePackage | LocalPackage]) -> frozenset[str]:
+	# dataclass fields() reflects on every call; -Sl builds a stub per repo package
+	# and the block parser tests every key against this set
+	return frozenset(f.name for f in fields(cls))
+
 
 def _create_package_stub(repo: str, name: str, version: str) -> AvailablePackage:
-	defaults = {f.name: '' for f in fields(AvailablePackage)}
+	defaults = dict.fromkeys(_field_names(AvailablePackage), '')
 	defaults.update({'repository': repo, 'name': name, 'version': version})
 	return AvailablePackage(**defaults)
 
 
 def _update_package(pkg: AvailablePackage, detailed: AvailablePackage) -> None:
-	for f in fields(AvailablePackage):
-		setattr(pkg, f.name, getattr(detailed, f.name))
+	# AvailablePackage can't take slots (longest_key is a cached_property), so
+	# its fields live in __dict__ and copy over in one update
+	vars(pkg).update(vars(detailed))
 
 
 def enrich_package_info(pkg: AvailablePackage, prefetch: list[AvailablePackage] = []) -> None:
@@ -29,23 +41,19 @@ def enrich_package_info(pkg: AvailablePackage, prefetch: list[AvailablePackage]
 	if not to_enrich:
 		return
 
+	# index by name so each -Si block is matched in one lookup; the first
+	# entry for a name wins, as the old linear scan did
+	by_name: dict[str, AvailablePackage] = {}
+	for p in to_enrich:
+		by_name.setdefault(p.name, p)
+
 	# Batch fetch with single pacman call
 	with contextlib.suppress(Exception):
-		pkg_names = ' '.join(p.name for p in to_enrich)
-		current_package = []
-
-		for line in Pacman.run(f'-Si {pkg_names}'):
-			dec_line = line.decode().rstrip()
-			current_package.append(dec_line)
+		pkg_names = ' '.join(by_name)
 
-			if dec_line.startswith('Validated') and current_package:
-				detailed = _parse_package_output(current_package, AvailablePackage)
-				# Find matching package and update it
-				for p in to_enrich:
-					if p.name == detailed.name:
-						_update_package(p, detailed)
-						break
-				current_package = []
+		for detailed in _parse_package_blocks(Pacman.run(f'-Si {pkg_names}'), AvailablePackage):
+			if (target := by_name.get(detailed.name)) is not None:
+				_update_package(target, detailed)
 
 
 @lru_cache
@@ -64,8 +72,12 @@ def list_available_packages() -> dict[str, AvailablePackage]:
 	try:
 		# -Sl walks repos in conf order, so setdefault (not assignment) keeps the
 		# same winner pacman would pick when a name exists in more than one repo
-		for line in Pacman.run('-Sl'):
-			parts = line.decode().strip().split()
+		# -Sl prints every package in every repo, so decode the whole listing
+		# once rather than line by line. The bulk decode keeps the escape codes
+		# line iteration strips, so ask pacman for no color (it runs in a pty)
+		listing = Pacman.run('-Sl --color never').decode()
+		for line in listing.splitlines():
+			parts = line.split()
 			if len(parts) >= 3:
 				packages.setdefault(parts[1], _create_package_stub(parts[0], parts[1], parts[2]))
 	except Exception as e:
@@ -79,15 +91,19 @@ def _normalize_key_name(key: str) -> str:
 	return key.strip().lower().replace(' ', '_')
 
 
-def _parse_package_output[PackageType: (AvailablePackage, LocalPackage)](
-	package_meta: list[str],
+def _parse_package_blocks[PackageType: (AvailablePackage, LocalPackage)](
+	lines: Iterable[bytes],
 	cls: type[PackageType],
-) -> PackageType:
+) -> Iterator[PackageType]:
+	# fields are collected as the lines stream in and each package is emitted
+	# at its closing 'Validated By' line, so no per-package line list is kept
 	package: dict[str, str] = {}
-	valid_fields = {f.name for f in fields(cls)}
+	valid_fields = _field_names(cls)
 	current_key: str | None = None
 
-	for line in package_meta:
+	for raw in lines:
+		line = raw.decode().rstrip()
+
 		# indented lines continue the previous field's value (wrapped
 		# descriptions and multi-entry fields like Optional Deps)
 		if line and line[0] in ' \t':
@@ -104,4 +120,7 @@ def _parse_package_output[PackageType: (AvailablePackage, LocalPackage)](
 			else:
 				current_key = None
 
-	return cls(**package)
+		if line.startswith('Validated'):
+			yield cls(**package)
+			package = {}
+			current_key = None
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import TYPE_CHECKING
 
 from archinstoo.lib.hardware import GfxDriver, SysInfo
@@ -10,6 +11,18 @@ if TYPE_CHECKING:
 	from archinstoo.lib.profile.base import Profile
 
 
+@cache
+def _hardware_hints() -> str:
+	# the machine does not change mid-run, so neither do the hints
+	hints = [
+		(SysInfo.is_vm, 'VM detected: use VM (software rendering) or VM (virtio-gpu) options.'),
+		(SysInfo.has_amd_graphics, 'AMD detected: use All open-source, AMD / ATI, or Mesa (open-source) options.'),
+		(SysInfo.has_intel_graphics, 'Intel detected: use All open-source, Intel (open-source), or Mesa (open-source) options.'),
+		(SysInfo.has_nvidia_graphics, 'Nvidia detected: for Turing+ use open-kernel, otherwise use AUR for legacy drivers.'),
+	]
+	return ''.join(f'{hint}\n' for detected, hint in hints if detected())
+
+
 def select_driver(
 	options: list[GfxDriver] = [],
 	preset: GfxDriver | None = None,
@@ -47,19 +60,9 @@ def select_driver(
 	if preset is not None:
 		group.set_focus_by_value(preset)
 
-	header = ''
-	if SysInfo.is_vm():
-		header += 'VM detected: use VM (software rendering) or VM (virtio-gpu) options.\n'
-	if SysInfo.has_amd_graphics():
-		header += 'AMD detected: use All open-source, AMD / ATI, or Mesa (open-source) options.\n'
-	if SysInfo.has_intel_graphics():
-		header += 'Intel detected: use All open-source, Intel (open-source), or Mesa (open-source) options.\n'
-	if SysInfo.has_nvidia_graphics():
-		header += 'Nvidia detected: for Turing+ use open-kernel, otherwise use AUR for legacy drivers.\n'
-
 	result = SelectMenu[GfxDriver](
 		group,
-		header=header,
+		header=_hardware_hints(),
 		allow_skip=True,
 		allow_reset=True,
 		preview_size='auto',
@@ -81,31 +81,28 @@ class ProfileMenu(AbstractSubMenu[ProfileConfiguration]):
 
 	def _select_profiles(self, preset: list[Profile]) -> list[Profile]:
 		profiles = select_profiles(preset)
+		gfx_item = self._item_group.find_by_key('gfx_driver')
+		greeter_item = self._item_group.find_by_key('greeter')
 
 		if profiles:
 			# Check if any profile needs display servers
-			has_display_servers = any(p.display_servers() for p in profiles)
-			if has_display_servers:
-				self._item_group.find_by_key('gfx_driver').enabled = True
-			else:
-				self._item_group.find_by_key('gfx_driver').enabled = False
-				self._item_group.find_by_key('gfx_driver').value = None
+			gfx_item.enabled = any(p.display_servers() for p in profiles)
+			if not gfx_item.enabled:
+				gfx_item.value = None
 
 			# Check if any profile supports greeter
-			supports_greeter = any(p.is_greeter_supported() for p in profiles)
-			if not supports_greeter:
-				self._item_group.find_by_key('greeter').enabled = False
-				self._item_group.find_by_key('greeter').value = None
+			greeter_item.enabled = any(p.is_greeter_supported() for p in profiles)
+			if not greeter_item.enabled:
+				greeter_item.value = None
 			else:
-				self._item_group.find_by_key('greeter').enabled = True
 				# Get default greeter from first desktop profile
 				for p in profiles:
 					if p.default_greeter_type:
-						self._item_group.find_by_key('greeter').value = p.default_greeter_type
+						greeter_item.value = p.default_greeter_type
 						break
 		else:
-			self._item_group.find_by_key('gfx_driver').value = None
-			self._item_group.find_by_key('greeter').value = None
+			gfx_item.value = None
+			greeter_item.value = None
 
 		customize_item = self._item_group.find_by_key(f'{CONFIG_KEY}_customize_packages')
 		if customize_item is not None:
@@ -193,14 +190,11 @@ class ProfileMenu(AbstractSubMenu[ProfileConfiguration]):
 					text += f'  {profile.name}: '
 					text += ', '.join([p.name for p in sub_profiles]) + '\n'
 
-			# Collect all packages
-			all_packages: set[str] = set()
-			for profile in profiles:
-				if profile.packages:
-					all_packages.update(profile.packages)
-				for sub in profile.current_selection:
-					if sub.packages:
-						all_packages.update(sub.packages)
+			# Collect all packages, reading each (possibly computed) packages list once
+			all_packages: set[str] = set().union(
+				*(profile.packages for profile in profiles),
+				*(sub.packages for profile in profiles for sub in profile.current_selection),
+			)
 
 			if all_packages:
 				text += 'Installed packages' + ':\n'
@@ -1231,6 +1231,7 @@ class SelectMenu[ValueT](AbstractCurses[ValueT]):
 					if item:
 						if item.action:
 							item.value = item.action(item.value)
+							self._item_group.mark_changed()
 
 						if self._item_group.is_mandatory_fulfilled():
 							return Result(ResultType.Selection, self._item_group.focus_item)
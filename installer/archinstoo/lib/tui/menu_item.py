@@ -92,7 +92,16 @@ class MenuItemGroup:
 		self._checkmarks: bool = checkmarks
 
 		self._menu_items: list[MenuItem] = menu_items
+		# key index for find_by_key; first item wins on duplicate keys
+		self._items_by_key: dict[str, MenuItem] = {}
+		for item in menu_items:
+			if item.key is not None:
+				self._items_by_key.setdefault(item.key, item)
+
 		self.focus_item: MenuItem | None = focus_item
+		# bumped by the menu framework whenever it assigns item values, so
+		# state derived from them can be memoized until something changes
+		self._version = 0
 		self.selected_items: list[MenuItem] = []
 		self.default_item: MenuItem | None = default_item
 
@@ -104,15 +113,22 @@ class MenuItemGroup:
 
 	def add_item(self, item: MenuItem) -> None:
 		self._menu_items.append(item)
+		if item.key is not None:
+			self._items_by_key.setdefault(item.key, item)
 		# reset cached_property if it has been computed
 		self.__dict__.pop('items', None)
 
-	def find_by_key(self, key: str) -> MenuItem:
-		for item in self._menu_items:
-			if item.key == key:
-				return item
+	@property
+	def version(self) -> int:
+		return self._version
+
+	def mark_changed(self) -> None:
+		self._version += 1
 
-		raise ValueError(f'No key found for: {key}')
+	def find_by_key(self, key: str) -> MenuItem:
+		if (item := self._items_by_key.get(key)) is None:
+			raise ValueError(f'No key found for: {key}')
+		return item
 
 	def get_enabled_items(self) -> list[MenuItem]:
 		return [it for it in self.items if self.is_enabled(it)]
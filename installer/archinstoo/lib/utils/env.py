@@ -1,6 +1,7 @@
 import os
 import platform
 import sys
+from functools import cache
 from pathlib import Path
 from shutil import which
 
@@ -21,8 +22,10 @@ class Os:
 		return key in os.environ
 
 	@staticmethod
+	@cache
 	def running_from_host() -> bool:
-		# returns True when not on the ISO
+		# returns True when not on the ISO; the archiso mount can't appear or
+		# vanish mid-run, so the stat is done once
 		return not Path('/run/archiso').exists()
 
 	@staticmethod
@@ -5,16 +5,20 @@
 # module-level entrypoint so both scripts can import it without side effects.
 
 import json
+import os
 import re
+import subprocess
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from archinstoo.lib.exceptions import RequirementError
-from archinstoo.lib.general import SysCommand
 from archinstoo.lib.models.network import NicType
 from archinstoo.lib.utils.env import Os
 
 if TYPE_CHECKING:
+	from collections.abc import Iterator
+
 	from archinstoo.lib.profile.base import Profile
 	from archinstoo.lib.profile.profiles_handler import ProfileSerialization
 
@@ -278,6 +282,53 @@ def _clean_dep(name: str) -> str | None:
 
 
 _TREE_PREFIX_RE = re.compile(r'^[\s│├└─]*')
+# pactree runs kept in flight at once by resolve_deps
+_PACTREE_JOBS = os.cpu_count() or 4
+
+
+def _parse_pactree(output: bytes) -> set[str]:
+	deps: set[str] = set()
+	for line in output.decode(errors='replace').splitlines():
+		raw = line.rstrip()
+		if not raw:
+			continue
+		m = _TREE_PREFIX_RE.match(raw)
+		rest = raw[m.end() if m else 0 :].split(' provides ', 1)[0]
+		if name := _clean_dep(rest):
+			deps.add(name)
+	return deps
+
+
+def _pactree_closures(pkgs: list[str]) -> Iterator[tuple[str, set[str] | None]]:
+	# pactree is one package per run and each run spends most of its time
+	# loading the sync dbs, so keep a window of runs in flight and collect
+	# them in order. Plain processes rather than SysCommand on threads:
+	# SysCommand chdir()s and pty.fork()s, both process-wide.
+	# A run that exits non-zero yields None in place of its closure.
+	env = {**os.environ, 'LC_ALL': 'C'}  # same locale SysCommand pins
+	pactree = Os.locate_binary('pactree')
+	running: deque[tuple[str, subprocess.Popen[bytes]]] = deque()
+	queued = iter(pkgs)
+
+	def spawn() -> None:
+		if (pkg := next(queued, None)) is not None:
+			proc = subprocess.Popen([pactree, '-s', pkg], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)  # noqa: S603 - argv list, no shell
+			running.append((pkg, proc))
+
+	try:
+		for _ in range(_PACTREE_JOBS):
+			spawn()
+
+		while running:
+			pkg, proc = running.popleft()
+			output, _ = proc.communicate()
+			spawn()
+			yield pkg, (_parse_pactree(output) if proc.returncode == 0 else None)
+	finally:
+		# Ctrl-C mid-resolve: don't leave the rest of the window running
+		for _, proc in running:
+			proc.kill()
+			proc.wait()
 
 
 def resolve_deps(explicit: set[str], target: str | None = None) -> tuple[set[str], list[str]]:
@@ -295,24 +346,16 @@ def resolve_deps(explicit: set[str], target: str | None = None) -> tuple[set[str
 
 	resolved: set[str] = set()
 	roots_for_target: list[str] = []
+	failed: list[str] = []
 
 	pkgs = sorted(explicit)
 	total = len(pkgs)
 
-	for i, pkg in enumerate(pkgs, 1):
-		deps: set[str] = set()
-		try:
-			output = SysCommand(f'pactree -s {pkg}')
-			for line in output:
-				raw = line.decode().rstrip()
-				if not raw:
-					continue
-				m = _TREE_PREFIX_RE.match(raw)
-				rest = raw[m.end() if m else 0 :].split(' provides ', 1)[0]
-				if name := _clean_dep(rest):
-					deps.add(name)
-		except Exception:
-			deps.add(pkg)
+	for i, (pkg, deps) in enumerate(_pactree_closures(pkgs), 1):
+		if deps is None:
+			# an unknown or broken package counts as itself, as before
+			failed.append(pkg)
+			deps = {pkg}
 
 		resolved.update(deps)
 		if target and pkg != target and target in deps:
@@ -321,4 +364,7 @@ def resolve_deps(explicit: set[str], target: str | None = None) -> tuple[set[str
 		print(f'\r  {i}/{total} | resolved: {len(resolved)}', end='', flush=True)
 
 	print()
+	if failed:
+		print(f'pactree failed for {len(failed)} package(s), counted without deps: {" ".join(failed)}')
+
 	return resolved, roots_for_target
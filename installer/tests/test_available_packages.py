@@ -5,14 +5,17 @@ import pytest
 
 from archinstoo.lib.linux_path import LPath
 from archinstoo.lib.models.mirrors import CustomRepository, SignCheck, SignOption
-from archinstoo.lib.models.packages import Repository
+from archinstoo.lib.models.packages import AvailablePackage, Repository
 from archinstoo.lib.pacman import Pacman
 from archinstoo.lib.pm import config, packages
 from archinstoo.lib.pm.config import PacmanConfig
 
 if TYPE_CHECKING:
+	from collections.abc import Iterator
 	from pathlib import Path
 
+_SL_ARGS = '-Sl --color never'
+
 # `pacman -Sl` on a host with multilib and third-party repos enabled. Repo order
 # is conf order; `nano` deliberately appears in two repos.
 _SL_OUTPUT = [
@@ -26,6 +29,18 @@ _SL_OUTPUT = [
 ]
 
 
+class _FakeSysCommand:
+	# the parts of SysCommand the package code reads: lines and a bulk decode
+	def __init__(self, lines: list[bytes]) -> None:
+		self._lines = lines
+
+	def __iter__(self) -> Iterator[bytes]:
+		return iter(self._lines)
+
+	def decode(self) -> str:
+		return b''.join(self._lines).decode().strip()
+
+
 @pytest.fixture(autouse=True)
 def _clear_cache() -> None:
 	packages.list_available_packages.cache_clear()
@@ -34,9 +49,9 @@ def _clear_cache() -> None:
 def _stub_pacman(monkeypatch: pytest.MonkeyPatch, output: list[bytes]) -> list[str]:
 	calls: list[str] = []
 
-	def run(args: str, **kwargs: object) -> list[bytes]:
+	def run(args: str, **kwargs: object) -> _FakeSysCommand:
 		calls.append(args)
-		return output if args == '-Sl' else []
+		return _FakeSysCommand(output if args == _SL_ARGS else [])
 
 	monkeypatch.setattr(Pacman, 'run', staticmethod(run))
 	return calls
@@ -48,7 +63,7 @@ def test_lists_every_repo_in_the_conf(monkeypatch: pytest.MonkeyPatch) -> None:
 	available = packages.list_available_packages()
 
 	# no repo names passed to pacman: the conf decides
-	assert calls == ['-Sy', '-Sl']
+	assert calls == ['-Sy', _SL_ARGS]
 	assert set(available) == {'linux', 'nano', 'neovim', 'lib32-glibc', 'ananicy-cpp'}
 	assert available['lib32-glibc'].repository == 'multilib'
 	assert available['ananicy-cpp'].version == '1.1.1-3'
@@ -74,10 +89,10 @@ def test_repo_order_follows_the_conf(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_sync_failure_still_lists_packages(monkeypatch: pytest.MonkeyPatch) -> None:
-	def run(args: str, **kwargs: object) -> list[bytes]:
+	def run(args: str, **kwargs: object) -> _FakeSysCommand:
 		if args == '-Sy':
 			raise OSError('no network')
-		return _SL_OUTPUT
+		return _FakeSysCommand(_SL_OUTPUT)
 
 	monkeypatch.setattr(Pacman, 'run', staticmethod(run))
 
@@ -85,7 +100,7 @@ def test_sync_failure_still_lists_packages(monkeypatch: pytest.MonkeyPatch) -> N
 
 
 def test_list_failure_yields_empty(monkeypatch: pytest.MonkeyPatch) -> None:
-	def run(args: str, **kwargs: object) -> list[bytes]:
+	def run(args: str, **kwargs: object) -> _FakeSysCommand:
 		raise OSError('pacman missing')
 
 	monkeypatch.setattr(Pacman, 'run', staticmethod(run))
@@ -93,6 +108,100 @@ def test_list_failure_yields_empty(monkeypatch: pytest.MonkeyPatch) -> None:
 	assert packages.list_available_packages() == {}
 
 
+# `pacman -Si neovim nano`: two blocks, each closed by 'Validated By', with a
+# wrapped description and a multi-line Optional Deps field
+_SI_OUTPUT = [
+	b'Repository      : extra\n',
+	b'Name            : neovim\n',
+	b'Version         : 0.12.2-1\n',
+	b'Description     : Fork of Vim aiming to improve user experience, plugins,\n',
+	b'                  and GUIs\n',
+	b'Architecture    : x86_64\n',
+	b'URL             : https://neovim.io\n',
+	b'Licenses        : custom:neovim  Apache-2.0\n',
+	b'Groups          : None\n',
+	b'Provides        : vim-plugin-runtime\n',
+	b'Depends On      : libluv  libutf8proc  luajit  msgpack-c  tree-sitter  unibilium\n',
+	b'Optional Deps   : python-pynvim: for Python plugin support\n',
+	b'                  xclip: for clipboard support on X11\n',
+	b'                  wl-clipboard: for clipboard support on wayland\n',
+	b'Conflicts With  : None\n',
+	b'Replaces        : None\n',
+	b'Download Size   : 7.12 MiB\n',
+	b'Installed Size  : 30.24 MiB\n',
+	b'Packager        : Caleb Maclennan <alerque@archlinux.org>\n',
+	b'Build Date      : Sat 10 Oct 2026 12:00:00 UTC\n',
+	b'Validated By    : MD5 Sum  SHA-256 Sum  Signature\n',
+	b'\n',
+	b'Repository      : core\n',
+	b'Name            : nano\n',
+	b'Version         : 8.7-1\n',
+	b'Description     : Pico editor clone with enhancements\n',
+	b'Architecture    : x86_64\n',
+	b'URL             : https://www.nano-editor.org\n',
+	b'Licenses        : GPL-3.0-or-later\n',
+	b'Groups          : None\n',
+	b'Provides        : None\n',
+	b'Depends On      : ncurses  file  sh\n',
+	b'Optional Deps   : None\n',
+	b'Conflicts With  : None\n',
+	b'Replaces        : None\n',
+	b'Download Size   : 612.30 KiB\n',
+	b'Installed Size  : 2.60 MiB\n',
+	b'Packager        : Sebastien Luttringer <seblu@archlinux.org>\n',
+	b'Build Date      : Mon 05 Oct 2026 08:00:00 UTC\n',
+	b'Validated By    : MD5 Sum  SHA-256 Sum  Signature\n',
+	b'\n',
+]
+
+
+def test_si_blocks_parse_into_packages() -> None:
+	neovim, nano = packages._parse_package_blocks(_SI_OUTPUT, AvailablePackage)
+
+	assert (neovim.repository, neovim.name, neovim.version) == ('extra', 'neovim', '0.12.2-1')
+	assert (nano.repository, nano.name, nano.version) == ('core', 'nano', '8.7-1')
+	# values containing ':' keep everything after the first separator
+	assert neovim.url == 'https://neovim.io'
+	assert neovim.build_date == 'Sat 10 Oct 2026 12:00:00 UTC'
+	# indented lines fold into the field above them
+	assert neovim.description == 'Fork of Vim aiming to improve user experience, plugins, and GUIs'
+	assert neovim.optional_deps == (
+		'python-pynvim: for Python plugin support xclip: for clipboard support on X11 wl-clipboard: for clipboard support on wayland'
+	)
+	# and stop at the next field, not bleeding into the following block
+	assert neovim.conflicts_with == 'None'
+	assert nano.description == 'Pico editor clone with enhancements'
+	assert nano.optional_deps == 'None'
+
+
+def test_enrich_merges_si_fields_onto_the_stubs(monkeypatch: pytest.MonkeyPatch) -> None:
+	calls: list[str] = []
+
+	def run(args: str, **kwargs: object) -> _FakeSysCommand:
+		calls.append(args)
+		return _FakeSysCommand(_SI_OUTPUT)
+
+	monkeypatch.setattr(Pacman, 'run', staticmethod(run))
+
+	neovim = packages._create_package_stub('extra', 'neovim', '0.12.2-1')
+	nano = packages._create_package_stub('core', 'nano', '8.7-1')
+	packages.enrich_package_info(neovim, prefetch=[nano])
+
+	# one batched -Si call for the package and its prefetch
+	assert calls == ['-Si neovim nano']
+	# the stubs are updated in place, every -Si field included
+	assert neovim.description == 'Fork of Vim aiming to improve user experience, plugins, and GUIs'
+	assert neovim.packager == 'Caleb Maclennan <alerque@archlinux.org>'
+	assert neovim.optional_deps.startswith('python-pynvim: ')
+	assert nano.depends_on == 'ncurses  file  sh'
+	assert nano.installed_size == '2.60 MiB'
+	assert nano == next(p for p in packages._parse_package_blocks(_SI_OUTPUT, AvailablePackage) if p.name == 'nano')
+
+	# already described packages are not looked up again
+	packages.enrich_package_info(neovim, prefetch=[nano])
+	assert len(calls) == 1
+
+
 # --- enable a repo, then see its packages -------------------------------------
 #
 # The half above stubs `pacman -Sl` outright. These drive the real loop instead:
@@ -130,16 +239,16 @@ def conf(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> LPath:
 	pacman_conf.write_text(_STOCK_CONF)
 	monkeypatch.setattr(config, 'PACMAN_CONF', pacman_conf)
 
-	def run(args: str, **kwargs: object) -> list[bytes]:
-		if args != '-Sl':
-			return []
+	def run(args: str, **kwargs: object) -> _FakeSysCommand:
+		if args != _SL_ARGS:
+			return _FakeSysCommand([])
 
 		lines = []
 		for repo in re.findall(r'^\[([^\]]+)\]', pacman_conf.read_text(), re.MULTILINE):
 			for name, version in _FAKE_DB.get(repo, []):
 				lines.append(f'{repo} {name} {version}\n'.encode())
 
-		return lines
+		return _FakeSysCommand(lines)
 
 	monkeypatch.setattr(Pacman, 'run', staticmethod(run))
 	return pacman_conf
@@ -193,3 +302,24 @@ def test_stale_cache_hides_a_new_repo(conf: LPath) -> None:
 	assert 'lib32-glibc' not in packages.list_available_packages()
 	packages.list_available_packages.cache_clear()
 	assert 'lib32-glibc' in packages.list_available_packages()
+
+
+def test_commented_custom_repo_is_added_active(conf: LPath) -> None:
+	# a leftover '#[cachyos]' block must not count as the repo already being there
+	conf.write_text(_STOCK_CONF + '\n#[cachyos]\n#Server = https://mirror.cachyos.org/repo/x86_64/cachyos\n')
+
+	pacman = PacmanConfig(None)
+	pacman.enable_custom(
+		[
+			CustomRepository(
+				'cachyos',
+				'https://mirror.cachyos.org/repo/x86_64/cachyos',
+				SignCheck.Required,
+				SignOption.TrustedOnly,
+			)
+		]
+	)
+	pacman.apply()
+
+	assert re.search(r'^\[cachyos\]$', conf.read_text(), re.MULTILINE)
+	assert 'ananicy-cpp' in packages.list_available_packages()
@@ -286,3 +286,17 @@ def test_set_locale_unknown_entry_fails(tmp_path: Path, monkeypatch: pytest.Monk
 
 	assert not installation.set_locale(LocaleConfiguration('us', 'xx_XX', 'UTF-8'))
 	assert not (tmp_path / 'etc/locale.conf').exists()
+
+
+def test_cached_lister_retries_an_empty_answer() -> None:
+	# an offline fetch fallback answers [], which must not stick for the session
+	answers = [[], ['us', 'de']]
+
+	@loc_utils._cache_found
+	def lister() -> list[str]:
+		return answers.pop(0)
+
+	assert lister() == []
+	assert lister() == ['us', 'de']
+	assert lister() == ['us', 'de']
+	assert not answers
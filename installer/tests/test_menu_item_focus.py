@@ -3,6 +3,8 @@
 # focus in place when nothing in the new view is selectable. Arrow keys then
 # hit _find_next_selectable_item, which must not blow up on the lookup.
 
+import pytest
+
 from archinstoo.lib.tui.menu_item import MenuItem, MenuItemGroup
 
 
@@ -36,3 +38,41 @@ def test_focus_survives_filter_with_no_matches() -> None:
 	group.focus_prev()
 
 	assert group.focus_item is not None
+
+
+# find_by_key goes through an index built in __init__ and kept up by add_item;
+# it must answer exactly like the first-match scan it replaced
+
+
+def test_find_by_key_duplicate_resolves_to_first() -> None:
+	first = MenuItem('first', value=1, key='dup')
+	second = MenuItem('second', value=2, key='dup')
+	group = MenuItemGroup([MenuItem('unkeyed', value=0), first, second])
+
+	assert group.find_by_key('dup') is first
+
+
+def test_add_item_updates_key_index() -> None:
+	group = _group()
+	added = MenuItem('delta', value='d', key='delta')
+
+	group.add_item(added)
+
+	assert group.find_by_key('delta') is added
+	assert added in group.items
+
+
+def test_add_item_does_not_shadow_existing_key() -> None:
+	first = MenuItem('first', value=1, key='dup')
+	group = MenuItemGroup([first])
+
+	group.add_item(MenuItem('later', value=2, key='dup'))
+
+	assert group.find_by_key('dup') is first
+
+
+def test_find_by_key_missing_raises() -> None:
+	group = _group()
+
+	with pytest.raises(ValueError, match='No key found for: nope'):
+		group.find_by_key('nope')
@@ -0,0 +1,113 @@
+# Previews memoized on MenuItemGroup.version are only as fresh as the bumps:
+# every place the menu framework assigns item values must move the version,
+# or the cached preview keeps showing the old value.
+
+from types import SimpleNamespace
+
+from archinstoo.lib.global_menu import GlobalMenu, _versioned_preview
+from archinstoo.lib.menu.abstract_menu import AbstractMenu
+from archinstoo.lib.tui.curses_menu import SelectMenu
+from archinstoo.lib.tui.menu_item import MenuItem, MenuItemGroup
+from archinstoo.lib.tui.types import MenuKeys
+
+# values seen by each real render, as opposed to cache hits
+_rendered: list[object] = []
+
+
+@_versioned_preview
+def _prev_hostname(menu: GlobalMenu, item: MenuItem) -> str | None:
+	_rendered.append(item.value)
+	return f'Hostname: {item.value}'
+
+
+def _group(*extra: MenuItem) -> MenuItemGroup:
+	return MenuItemGroup(
+		[
+			MenuItem('Hostname', value='arch', key='hostname'),
+			MenuItem('Packages', value=['vim'], key='packages'),
+			*extra,
+		]
+	)
+
+
+def _owner(group: MenuItemGroup) -> GlobalMenu:
+	# only the state _versioned_preview reads; the real constructor probes the host
+	_rendered.clear()
+	menu = GlobalMenu.__new__(GlobalMenu)
+	menu._item_group = group
+	menu._preview_cache = {}
+	return menu
+
+
+def test_preview_is_reused_until_the_version_moves() -> None:
+	group = _group()
+	owner = _owner(group)
+	item = group.find_by_key('hostname')
+
+	assert _prev_hostname(owner, item) == 'Hostname: arch'
+	item.value = 'box'
+	# no bump yet: the cached text stands
+	assert _prev_hostname(owner, item) == 'Hostname: arch'
+	assert _rendered == ['arch']
+
+	group.mark_changed()
+
+	assert _prev_hostname(owner, item) == 'Hostname: box'
+	assert _rendered == ['arch', 'box']
+
+
+def test_accept_bumps_the_version() -> None:
+	item = MenuItem('Timezone', value='UTC', key='timezone', action=lambda _: 'Europe/Paris')
+	group = _group(item)
+	group.focus_item = item
+	owner = _owner(group)
+	_prev_hostname(owner, item)
+
+	# only the state the ACCEPT branch reads, no curses screen behind it
+	menu = SimpleNamespace(_help_active=False, _active_search=False, _search_enabled=False, _multi=False, _item_group=group)
+	SelectMenu._process_input_key(menu, next(iter(MenuKeys.ACCEPT.value)))  # type: ignore[arg-type]
+
+	assert item.value == 'Europe/Paris'
+	assert _prev_hostname(owner, item) == 'Hostname: Europe/Paris'
+
+
+def test_sync_from_config_bumps_the_version() -> None:
+	group = _group()
+	config = SimpleNamespace(hostname='arch', packages=['vim'])
+	menu = AbstractMenu[None](group, config)
+	owner = _owner(group)
+	item = group.find_by_key('hostname')
+	_prev_hostname(owner, item)
+
+	config.hostname = 'box'
+	menu._sync_from_config()
+
+	assert _prev_hostname(owner, item) == 'Hostname: box'
+
+
+def test_reset_items_bumps_the_version() -> None:
+	group = _group()
+	menu = AbstractMenu[None](group, SimpleNamespace(hostname='arch', packages=['vim']))
+	owner = _owner(group)
+	item = group.find_by_key('hostname')
+	_prev_hostname(owner, item)
+
+	menu._reset_items()
+
+	assert group.find_by_key('packages').value == []
+	assert _prev_hostname(owner, item) == 'Hostname: None'
+
+
+def test_set_mandatory_bumps_the_version() -> None:
+	# mandatory flips what the Install preview reports missing, not any value
+	group = _group()
+	menu = AbstractMenu[None](group, SimpleNamespace(hostname='arch', packages=['vim']))
+	owner = _owner(group)
+	item = group.find_by_key('hostname')
+	_prev_hostname(owner, item)
+
+	menu.set_mandatory('hostname', True)
+	_prev_hostname(owner, item)
+
+	assert item.mandatory
+	assert _rendered == ['arch', 'arch']
@@ -0,0 +1,76 @@
+import subprocess
+
+import pytest
+
+from archinstoo.lib.utils.env import Os
+from archinstoo.scripts import _resolve
+
+# `pactree -s <pkg>` per package; anything not listed exits 1 like an unknown target
+_PACTREE = {
+	'bash': 'bash\n├─readline\n│ └─ncurses\n└─glibc\n',
+	'networkmanager': 'networkmanager\n├─libnm provides libnm.so=0-64\n└─glibc>=2.40\n',
+	'nano': 'nano\n├─ncurses\n└─file\n',
+}
+
+
+# argv of every run started, in spawn order
+_spawned: list[list[str]] = []
+
+
+class _FakePactree:
+	# a finished pactree run: output and exit code are known up front
+	def __init__(self, argv: list[str], **kwargs: object) -> None:
+		_spawned.append(argv)
+		self._output = _PACTREE.get(argv[-1], '').encode()
+		self.returncode = 0 if argv[-1] in _PACTREE else 1
+
+	def communicate(self) -> tuple[bytes, None]:
+		return self._output, None
+
+	def kill(self) -> None:
+		pass
+
+	def wait(self) -> int:
+		return self.returncode
+
+
+@pytest.fixture(autouse=True)
+def _fake_pactree(monkeypatch: pytest.MonkeyPatch) -> None:
+	_spawned.clear()
+	monkeypatch.setattr(Os, 'locate_binary', staticmethod(lambda name: f'/usr/bin/{name}'))
+	monkeypatch.setattr(subprocess, 'Popen', _FakePactree)
+	# a window smaller than the package list, so runs are refilled as they finish
+	monkeypatch.setattr(_resolve, '_PACTREE_JOBS', 2)
+
+
+def test_closures_come_back_in_package_order() -> None:
+	closures = list(_resolve._pactree_closures(['bash', 'nano', 'networkmanager']))
+
+	assert _spawned == [
+		['/usr/bin/pactree', '-s', 'bash'],
+		['/usr/bin/pactree', '-s', 'nano'],
+		['/usr/bin/pactree', '-s', 'networkmanager'],
+	]
+	assert closures == [
+		('bash', {'bash', 'readline', 'ncurses', 'glibc'}),
+		('nano', {'nano', 'ncurses', 'file'}),
+		# the provider is kept, the .so virtual and the version constraint are not
+		('networkmanager', {'networkmanager', 'libnm', 'glibc'}),
+	]
+
+
+def test_failed_run_is_not_a_closure() -> None:
+	closures = dict(_resolve._pactree_closures(['bash', 'not-a-package', 'nano']))
+
+	assert closures['not-a-package'] is None
+	assert closures['nano'] == {'nano', 'ncurses', 'file'}
+
+
+def test_resolve_deps_reports_failed_runs(capsys: pytest.CaptureFixture[str]) -> None:
+	resolved, roots = _resolve.resolve_deps({'bash', 'not-a-package', 'nano'}, target='ncurses')
+
+	# still counted as itself, but the user is told its deps are missing
+	assert 'not-a-package' in resolved
+	assert resolved >= {'bash', 'readline', 'ncurses', 'glibc', 'file'}
+	assert roots == ['bash', 'nano']
+	assert 'pactree failed for 1 package(s), counted without deps: not-a-package' in capsys.readouterr().out
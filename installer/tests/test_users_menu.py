@@ -0,0 +1,69 @@
+# UserList.handle_action resolves the chosen entry by username, not by the
+# object the menu hands back. Actions are passed by their label, the way the
+# list manager dispatches them, so reordering _actions cannot mask a miss.
+
+import copy
+from typing import TYPE_CHECKING
+
+from archinstoo.lib.authentication import users_menu
+from archinstoo.lib.authentication.users_menu import UserList
+from archinstoo.lib.models.users import Shell, User
+
+if TYPE_CHECKING:
+	import pytest
+
+
+def _users() -> list[User]:
+	return [
+		User('alice', None, elev=True),
+		User('bob', None, elev=False),
+		User('carol', None, elev=False),
+	]
+
+
+def test_action_applies_to_the_user_with_that_name() -> None:
+	data = _users()
+	# the menu's selection is an equal copy, not the object held in data
+	entry = copy.deepcopy(data[1])
+
+	result = UserList('Users', data).handle_action('Promote/Demote user', entry, data)
+
+	assert [u.elev for u in result] == [True, True, False]
+	assert result[1] is data[1]
+
+
+def test_sub_menu_result_lands_on_the_keyed_user(monkeypatch: pytest.MonkeyPatch) -> None:
+	monkeypatch.setattr(users_menu, '_select_shell', lambda preset, elev: Shell.ZSH)
+	data = _users()
+
+	result = UserList('Users', data).handle_action('Change shell', copy.deepcopy(data[2]), data)
+
+	assert [u.shell for u in result] == [Shell.BASH, Shell.BASH, Shell.ZSH]
+
+
+def test_delete_drops_only_that_name_and_keeps_order() -> None:
+	data = _users()
+
+	result = UserList('Users', data).handle_action('Delete User', copy.deepcopy(data[1]), data)
+
+	assert [u.username for u in result] == ['alice', 'carol']
+
+
+def test_unknown_username_is_a_no_op() -> None:
+	data = _users()
+
+	result = UserList('Users', data).handle_action('Delete User', User('dave', None, elev=False), data)
+
+	assert result == data
+
+
+def test_add_replaces_same_name_and_moves_it_last(monkeypatch: pytest.MonkeyPatch) -> None:
+	readded = User('alice', None, elev=False, shell=Shell.FISH)
+	monkeypatch.setattr(UserList, '_add_user', lambda self: readded)
+	monkeypatch.setattr(UserList, '_run_actions_on_entry', lambda self, entry: None)
+	data = _users()
+
+	result = UserList('Users', data).handle_action('Add a user', None, data)
+
+	assert [u.username for u in result] == ['bob', 'carol', 'alice']
+	assert result[-1] is readded